@@ -6,14 +6,23 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from deploy_wizard.config import AccessMode, Config, IngressMode, SourceKind, default_base_dir
+if TYPE_CHECKING:
+    from deploy_wizard.config import Config
 
 
 def build_config(argv: Optional[List[str]] = None) -> Config:
     import argparse
 
+    from deploy_wizard.config import (
+        AccessMode,
+        Config,
+        IngressMode,
+        SourceKind,
+        default_base_dir,
+    )
+
     parser = argparse.ArgumentParser(
         prog="python -m deploy_wizard deploy --batch",
         description="Deploy a Docker microservice from a directory with compose or Dockerfile.",
@@ -69,6 +78,13 @@ def build_config(argv: Optional[List[str]] = None) -> Config:
         metavar="SEC",
         help="Initial retry backoff for registry/network errors. (default: 5)",
     )
+    parser.add_argument(
+        "--retry-backoff-max-seconds",
+        type=int,
+        default=60,
+        metavar="SEC",
+        help="Upper bound for a single retry backoff. (default: 60)",
+    )
     parser.add_argument(
         "--no-docker-daemon-tuning",
         action="store_true",
@@ -163,6 +179,7 @@ def build_config(argv: Optional[List[str]] = None) -> Config:
             ingress_mode=IngressMode(raw.ingress_mode),
             registry_retries=raw.registry_retries,
             retry_backoff_seconds=raw.retry_backoff_seconds,
+            retry_backoff_max_seconds=raw.retry_backoff_max_seconds,
             tune_docker_daemon=not raw.no_docker_daemon_tuning,
             compose_services=tuple(raw.compose_service) if raw.compose_service else None,
             domain=raw.domain,
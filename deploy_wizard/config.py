@@ -6,10 +6,12 @@ from __future__ import annotations
 
 import os
 import re
+import stat
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Mapping, Optional, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple
 
 
 class SourceKind(str, Enum):
@@ -38,8 +40,29 @@ _EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 _TOKEN_RE = re.compile(r"^[A-Za-z0-9._~+\-]{8,}$")
 _SERVER_NAME_RE = re.compile(r"^[A-Za-z0-9*_.-]+$")
 _UPSTREAM_HOST_RE = re.compile(r"^[A-Za-z0-9_.-]+$")
+_SLASH_RUN_RE = re.compile(r"/+")
 _PATH_PREFIX_RE = re.compile(r"^/[A-Za-z0-9._~!$&'()*+,;=:@%/\-]*$")
-_ENV_VAR_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+# Already-canonical routes (no blanks, no empty or trailing path segments).
+_CANONICAL_ROUTE_RE = re.compile(
+    r"^([A-Za-z0-9*_.-]+)((?:/[A-Za-z0-9._~!$&'()*+,;:@%\-]+)*)"
+    r"=([A-Za-z0-9_.-]+):([0-9]{1,5})$"
+)
+_ENV_REFERENCE_RE = re.compile(r"\$(?:(\$)|\{([^}]*)\}|([A-Za-z_][A-Za-z0-9_]*))")
+_BRACED_ENV_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)(?:(:?[-+?]).*)?$")
+_DOTENV_ENTRY_RE = re.compile(
+    r"^[^\S\n]*(?:export[^\S\n]+)?([A-Za-z_][A-Za-z0-9_]*)[^\S\n]*=(.*)$",
+    re.MULTILINE,
+)
+_COMPOSE_SERVICES_RE = re.compile(r"^(\s*)services\s*:\s*(?:$|#)")
+_COMPOSE_KEY_RE = re.compile(
+    r'^(\s*)(?:'
+    r'"([^"]+)"|'
+    r"'([^']+)'|"
+    r"([A-Za-z0-9_.-]+)"
+    r')\s*:\s*(?:$|#)'
+)
+_COMPOSE_PORT_SECTION_RE = re.compile(r"^\s*(ports|expose)\s*:\s*(?:$|#)")
+_COMPOSE_LIST_ITEM_RE = re.compile(r'^\s*-\s*("?)([^"]+)\1\s*(?:#.*)?$')
 
 
 @dataclass(frozen=True)
@@ -56,7 +79,7 @@ def _normalize_path_prefix(raw: str) -> str:
         return "/"
     if not text.startswith("/"):
         text = "/" + text
-    text = re.sub(r"/+", "/", text)
+    text = _SLASH_RUN_RE.sub("/", text)
     if len(text) > 1 and text.endswith("/"):
         text = text[:-1]
     if " " in text or not _PATH_PREFIX_RE.fullmatch(text):
@@ -67,8 +90,23 @@ def _normalize_path_prefix(raw: str) -> str:
     return text
 
 
+# Routes are frozen, so the wizard preview, CLI parsing and Config
+# validation can share one parse per spec string.
+@lru_cache(maxsize=256)
 def parse_proxy_route(raw: str) -> ProxyRoute:
     text = str(raw).strip()
+    match = _CANONICAL_ROUTE_RE.match(text)
+    if match is not None:
+        host, path, upstream_host, port_text = match.groups()
+        port = int(port_text)
+        if 1 <= port <= 65535:
+            return ProxyRoute(
+                host=host.lower(),
+                upstream_host=upstream_host,
+                upstream_port=port,
+                path_prefix=path.lower() or "/",
+            )
+    # Anything else goes through the step-by-step checks for a precise error.
     if not text:
         raise ValueError("proxy_route must not be empty.")
     if "=" not in text:
@@ -120,27 +158,11 @@ def parse_proxy_route(raw: str) -> ProxyRoute:
     )
 
 
-def _merge_env_requirement(
-    name: str,
-    level: int,
-    *,
-    order: List[str],
-    levels: Dict[str, int],
-) -> None:
-    if not _ENV_VAR_NAME_RE.fullmatch(name):
-        return
-    if name not in levels:
-        order.append(name)
-        levels[name] = level
-        return
-    levels[name] = max(levels[name], level)
-
-
 def _parse_braced_env_requirement(expr: str) -> Optional[Tuple[str, int]]:
     text = str(expr).strip()
     if not text:
         return None
-    match = re.match(r"^([A-Za-z_][A-Za-z0-9_]*)(?:(:?[-+?]).*)?$", text)
+    match = _BRACED_ENV_RE.match(text)
     if match is None:
         return None
     name = match.group(1)
@@ -153,85 +175,80 @@ def _parse_braced_env_requirement(expr: str) -> Optional[Tuple[str, int]]:
     return (name, 1)
 
 
+def _file_cache_key(path: Path) -> Optional[Tuple[str, int, int]]:
+    # The wizard runs several best-effort parsers over the same files; keying
+    # their caches on mtime/size lets them share one read while still seeing
+    # edits. A single stat answers both "is it a regular file" and the key.
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return os.fspath(path), st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=4)
+def _read_compose_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
 def list_compose_required_env_vars(compose_path: Path) -> Tuple[Tuple[str, bool], ...]:
     """
     Discover interpolation variables in compose files that require user-provided values.
 
     Returns tuples of (NAME, require_non_empty), preserving first-seen order.
     """
-    if not compose_path.exists() or not compose_path.is_file():
+    key = _file_cache_key(compose_path)
+    if key is None:
         return tuple()
+    return _required_env_vars_cached(*key)
 
-    content = compose_path.read_text(encoding="utf-8")
-    required_order: List[str] = []
-    required_levels: Dict[str, int] = {}
-    idx = 0
-
-    while idx < len(content):
-        if content[idx] != "$":
-            idx += 1
-            continue
-        if idx + 1 >= len(content):
-            break
 
-        nxt = content[idx + 1]
-        if nxt == "$":
+@lru_cache(maxsize=4)
+def _required_env_vars_cached(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, bool], ...]:
+    # Both match groups only admit valid names, and dict order is first-seen.
+    levels: Dict[str, int] = {}
+    for match in _ENV_REFERENCE_RE.finditer(_read_compose_text_cached(path, mtime_ns, size)):
+        escaped, braced, bare = match.groups()
+        if escaped is not None:
             # Escaped dollar sign (literal).
-            idx += 2
             continue
-        if nxt == "{":
-            end = content.find("}", idx + 2)
-            if end < 0:
-                idx += 1
+        if braced is not None:
+            parsed = _parse_braced_env_requirement(braced)
+            if parsed is None:
                 continue
-            parsed = _parse_braced_env_requirement(content[idx + 2:end])
-            if parsed is not None:
-                name, level = parsed
-                _merge_env_requirement(
-                    name,
-                    level,
-                    order=required_order,
-                    levels=required_levels,
-                )
-            idx = end + 1
-            continue
-
-        name_match = re.match(r"[A-Za-z_][A-Za-z0-9_]*", content[idx + 1 :])
-        if name_match is not None:
-            _merge_env_requirement(
-                name_match.group(0),
-                1,
-                order=required_order,
-                levels=required_levels,
-            )
-            idx += 1 + len(name_match.group(0))
-            continue
-
-        idx += 1
+            name, level = parsed
+        else:
+            name, level = bare, 1
+        if levels.get(name, 0) < level:
+            levels[name] = level
 
-    return tuple((name, required_levels[name] >= 2) for name in required_order)
+    return tuple((name, level >= 2) for name, level in levels.items())
 
 
 def read_dotenv_values(dotenv_path: Path) -> Dict[str, str]:
     """
     Read KEY=VALUE entries from a .env-like file.
     """
-    if not dotenv_path.exists() or not dotenv_path.is_file():
-        return {}
+    return dict(_dotenv_items(dotenv_path))
+
+
+def _dotenv_items(dotenv_path: Path) -> Tuple[Tuple[str, str], ...]:
+    key = _file_cache_key(dotenv_path)
+    if key is None:
+        return tuple()
+    return _dotenv_items_cached(*key)
+
 
+@lru_cache(maxsize=16)
+def _dotenv_items_cached(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, str], ...]:
     values: Dict[str, str] = {}
-    for raw in dotenv_path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("export "):
-            line = line[len("export ") :].strip()
-        if "=" not in line:
-            continue
-        key_raw, value_raw = line.split("=", 1)
-        key = key_raw.strip()
-        if not _ENV_VAR_NAME_RE.fullmatch(key):
-            continue
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    for match in _DOTENV_ENTRY_RE.finditer(text):
+        key, value_raw = match.groups()
         value = value_raw.strip()
         if len(value) >= 2 and (
             (value.startswith('"') and value.endswith('"'))
@@ -239,7 +256,7 @@ def read_dotenv_values(dotenv_path: Path) -> Dict[str, str]:
         ):
             value = value[1:-1]
         values[key] = value
-    return values
+    return tuple(values.items())
 
 
 def list_missing_compose_env_vars(
@@ -257,7 +274,7 @@ def list_missing_compose_env_vars(
 
     merged: Dict[str, str] = {}
     if dotenv_path is not None:
-        merged.update(read_dotenv_values(dotenv_path))
+        merged.update(_dotenv_items(dotenv_path))
     source_env = os.environ if env is None else env
     merged.update({str(k): str(v) for k, v in source_env.items()})
 
@@ -270,44 +287,88 @@ def list_missing_compose_env_vars(
 
 
 def find_compose_file(source_dir: Path) -> Optional[Path]:
+    name, _dockerfile_found = _scan_source_dir(source_dir)
+    return source_dir / name if name is not None else None
+
+
+def has_dockerfile(source_dir: Path) -> bool:
+    return _scan_source_dir(source_dir)[1]
+
+
+def _scan_source_dir(source_dir: Path) -> Tuple[Optional[str], bool]:
+    """
+    Return (compose file name or None, has Dockerfile) for a source dir.
+    """
+    # Adding or removing a file bumps the directory mtime, which invalidates
+    # the cached scan.
+    try:
+        mtime_ns = os.stat(source_dir).st_mtime_ns
+    except OSError:
+        return None, False
+    return _scan_source_dir_cached(os.fspath(source_dir), mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _scan_source_dir_cached(source_dir: str, mtime_ns: int) -> Tuple[Optional[str], bool]:
     candidates = (
         "docker-compose.yml",
         "docker-compose.yaml",
         "compose.yml",
         "compose.yaml",
     )
+    # One directory read answers every candidate instead of a stat per name.
+    # normcase keeps Windows' case-insensitive matching.
+    try:
+        with os.scandir(source_dir) as it:
+            files = {os.path.normcase(entry.name): entry.name for entry in it if entry.is_file()}
+    except OSError:
+        return None, False
+    dockerfile_found = os.path.normcase("Dockerfile") in files
     for name in candidates:
-        path = source_dir / name
-        if path.exists() and path.is_file():
-            return path
-    return None
+        found = files.get(os.path.normcase(name))
+        if found is not None:
+            return found, dockerfile_found
+    return None, dockerfile_found
 
 
 def list_compose_services(compose_path: Path) -> List[str]:
     """
     Best-effort parser for top-level `services:` keys in a compose YAML file.
     """
-    if not compose_path.exists() or not compose_path.is_file():
+    key = _file_cache_key(compose_path)
+    if key is None:
         return []
+    return list(_list_compose_services_cached(*key))
 
+
+def compose_service_names(compose_path: Path) -> FrozenSet[str]:
+    """
+    Top-level compose service names as a set, for membership checks.
+    """
+    key = _file_cache_key(compose_path)
+    if key is None:
+        return frozenset()
+    return _compose_service_names_cached(*key)
+
+
+@lru_cache(maxsize=4)
+def _compose_service_names_cached(path: str, mtime_ns: int, size: int) -> FrozenSet[str]:
+    return frozenset(_list_compose_services_cached(path, mtime_ns, size))
+
+
+@lru_cache(maxsize=4)
+def _list_compose_services_cached(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
     services_indent: Optional[int] = None
     child_indent: Optional[int] = None
     names: List[str] = []
-    key_pattern = re.compile(
-        r'^(\s*)(?:'
-        r'"([^"]+)"|'
-        r"'([^']+)'|"
-        r"([A-Za-z0-9_.-]+)"
-        r')\s*:\s*(?:$|#)'
-    )
 
-    for raw_line in compose_path.read_text(encoding="utf-8").splitlines():
+    for raw_line in _read_compose_text_cached(path, mtime_ns, size).splitlines():
         line = raw_line.rstrip()
         if not line or line.lstrip().startswith("#"):
             continue
 
         if services_indent is None:
-            services_match = re.match(r"^(\s*)services\s*:\s*(?:$|#)", line)
+            services_match = _COMPOSE_SERVICES_RE.match(line)
             if services_match is not None:
                 services_indent = len(services_match.group(1))
             continue
@@ -316,7 +377,7 @@ def list_compose_services(compose_path: Path) -> List[str]:
         if indent <= services_indent:
             break
 
-        key_match = key_pattern.match(raw_line)
+        key_match = _COMPOSE_KEY_RE.match(raw_line)
         if key_match is None:
             continue
 
@@ -330,29 +391,29 @@ def list_compose_services(compose_path: Path) -> List[str]:
         if name and name not in names:
             names.append(name)
 
-    return names
+    return tuple(names)
+
+
+def _to_port(raw: str) -> Optional[int]:
+    raw = raw.strip()
+    if not raw or not raw.isdecimal():
+        return None
+    value = int(raw)
+    if 1 <= value <= 65535:
+        return value
+    return None
 
 
 def _parse_port_mapping(token: str) -> Tuple[Optional[int], Optional[int]]:
     text = str(token).strip().strip("'").strip('"')
     if not text:
         return None, None
-    text = text.split("/", 1)[0].strip()
-    parts = [part.strip() for part in text.split(":")]
-
-    def _to_port(raw: str) -> Optional[int]:
-        if not raw or not raw.isdigit():
-            return None
-        value = int(raw)
-        if 1 <= value <= 65535:
-            return value
-        return None
-
-    if len(parts) == 1:
-        return None, _to_port(parts[0])
-    if len(parts) == 2:
-        return _to_port(parts[0]), _to_port(parts[1])
-    return _to_port(parts[-2]), _to_port(parts[-1])
+    text = text.split("/", 1)[0]
+    # Only the last two fields matter: [[IP:]HOST:]CONTAINER.
+    head, sep, container = text.rpartition(":")
+    if not sep:
+        return None, _to_port(container)
+    return _to_port(head.rpartition(":")[2]), _to_port(container)
 
 
 def _extract_container_port(token: str) -> Optional[int]:
@@ -365,28 +426,11 @@ def _extract_host_port(token: str) -> Optional[int]:
     return host_port
 
 
-def list_compose_service_ports(
-    compose_path: Path,
-    *,
-    include_expose: bool = True,
-) -> dict:
+def _iter_compose_port_items(text: str) -> Iterator[Tuple[str, str, str]]:
     """
-    Best-effort parser for first exposed/container port per compose service.
-    Supports common list forms in `ports:` and `expose:`.
-    Set include_expose=False to only include published host `ports:`.
+    Yield `(service, section, token)` for each list item under a service's
+    `ports:` or `expose:` key, in file order.
     """
-    if not compose_path.exists() or not compose_path.is_file():
-        return {}
-
-    key_pattern = re.compile(
-        r'^(\s*)(?:'
-        r'"([^"]+)"|'
-        r"'([^']+)'|"
-        r"([A-Za-z0-9_.-]+)"
-        r')\s*:\s*(?:$|#)'
-    )
-    item_pattern = re.compile(r'^\s*-\s*("?)([^"]+)\1\s*(?:#.*)?$')
-    ports = {}
     services_indent: Optional[int] = None
     service_indent: Optional[int] = None
     current_service: Optional[str] = None
@@ -394,14 +438,13 @@ def list_compose_service_ports(
     section: Optional[str] = None
     section_indent: Optional[int] = None
 
-    lines = compose_path.read_text(encoding="utf-8").splitlines()
-    for raw_line in lines:
+    for raw_line in text.splitlines():
         line = raw_line.rstrip()
         if not line or line.lstrip().startswith("#"):
             continue
 
         if services_indent is None:
-            services_match = re.match(r"^(\s*)services\s*:\s*(?:$|#)", line)
+            services_match = _COMPOSE_SERVICES_RE.match(line)
             if services_match is not None:
                 services_indent = len(services_match.group(1))
             continue
@@ -410,7 +453,7 @@ def list_compose_service_ports(
         if indent <= services_indent:
             break
 
-        key_match = key_pattern.match(raw_line)
+        key_match = _COMPOSE_KEY_RE.match(raw_line)
         if key_match is not None:
             key_indent = len(key_match.group(1))
             name = key_match.group(2) or key_match.group(3) or key_match.group(4) or ""
@@ -431,7 +474,7 @@ def list_compose_service_ports(
             section_indent = None
             continue
 
-        section_match = re.match(r"^\s*(ports|expose)\s*:\s*(?:$|#)", raw_line)
+        section_match = _COMPOSE_PORT_SECTION_RE.match(raw_line)
         if section_match is not None:
             section = section_match.group(1)
             section_indent = indent
@@ -441,22 +484,43 @@ def list_compose_service_ports(
             section = None
             section_indent = None
 
-        if (
-            section in ("ports", "expose")
-            and section_indent is not None
-            and indent > section_indent
-        ):
-            if section == "expose" and not include_expose:
-                continue
-            item_match = item_pattern.match(raw_line)
-            if item_match is None:
-                continue
-            if current_service in ports:
-                continue
-            parsed_port = _extract_container_port(item_match.group(2))
-            if parsed_port is not None:
-                ports[current_service] = parsed_port
+        if section is not None and section_indent is not None and indent > section_indent:
+            item_match = _COMPOSE_LIST_ITEM_RE.match(raw_line)
+            if item_match is not None:
+                yield current_service, section, item_match.group(2)
+
+
+def _compose_port_items(compose_path: Path) -> Tuple[Tuple[str, str, str], ...]:
+    key = _file_cache_key(compose_path)
+    if key is None:
+        return tuple()
+    return _compose_port_items_cached(*key)
+
+
+@lru_cache(maxsize=4)
+def _compose_port_items_cached(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[Tuple[str, str, str], ...]:
+    return tuple(_iter_compose_port_items(_read_compose_text_cached(path, mtime_ns, size)))
+
 
+def list_compose_service_ports(
+    compose_path: Path,
+    *,
+    include_expose: bool = True,
+) -> dict:
+    """
+    Best-effort parser for first exposed/container port per compose service.
+    Supports common list forms in `ports:` and `expose:`.
+    Set include_expose=False to only include published host `ports:`.
+    """
+    ports = {}
+    for service, section, token in _compose_port_items(compose_path):
+        if service in ports or (section == "expose" and not include_expose):
+            continue
+        parsed_port = _extract_container_port(token)
+        if parsed_port is not None:
+            ports[service] = parsed_port
     return ports
 
 
@@ -465,91 +529,21 @@ def list_compose_service_host_ports(compose_path: Path) -> dict:
     Best-effort parser for first published host port per compose service.
     Reads only `ports:` entries and ignores `expose:`.
     """
-    if not compose_path.exists() or not compose_path.is_file():
-        return {}
-
-    key_pattern = re.compile(
-        r'^(\s*)(?:'
-        r'"([^"]+)"|'
-        r"'([^']+)'|"
-        r"([A-Za-z0-9_.-]+)"
-        r')\s*:\s*(?:$|#)'
-    )
-    item_pattern = re.compile(r'^\s*-\s*("?)([^"]+)\1\s*(?:#.*)?$')
     ports = {}
-    services_indent: Optional[int] = None
-    service_indent: Optional[int] = None
-    current_service: Optional[str] = None
-    current_service_indent: Optional[int] = None
-    section: Optional[str] = None
-    section_indent: Optional[int] = None
-
-    lines = compose_path.read_text(encoding="utf-8").splitlines()
-    for raw_line in lines:
-        line = raw_line.rstrip()
-        if not line or line.lstrip().startswith("#"):
+    for service, section, token in _compose_port_items(compose_path):
+        if service in ports or section != "ports":
             continue
-
-        if services_indent is None:
-            services_match = re.match(r"^(\s*)services\s*:\s*(?:$|#)", line)
-            if services_match is not None:
-                services_indent = len(services_match.group(1))
-            continue
-
-        indent = len(raw_line) - len(raw_line.lstrip(" "))
-        if indent <= services_indent:
-            break
-
-        key_match = key_pattern.match(raw_line)
-        if key_match is not None:
-            key_indent = len(key_match.group(1))
-            name = key_match.group(2) or key_match.group(3) or key_match.group(4) or ""
-            if service_indent is None and name:
-                service_indent = key_indent
-            if name and service_indent is not None and key_indent == service_indent:
-                current_service = name
-                current_service_indent = key_indent
-                section = None
-                section_indent = None
-                continue
-
-        if current_service is None or current_service_indent is None:
-            continue
-        if indent <= current_service_indent:
-            current_service = None
-            section = None
-            section_indent = None
-            continue
-
-        section_match = re.match(r"^\s*ports\s*:\s*(?:$|#)", raw_line)
-        if section_match is not None:
-            section = "ports"
-            section_indent = indent
-            continue
-
-        if section is not None and section_indent is not None and indent <= section_indent:
-            section = None
-            section_indent = None
-
-        if section == "ports" and section_indent is not None and indent > section_indent:
-            item_match = item_pattern.match(raw_line)
-            if item_match is None:
-                continue
-            if current_service in ports:
-                continue
-            parsed_port = _extract_host_port(item_match.group(2))
-            if parsed_port is not None:
-                ports[current_service] = parsed_port
-
+        parsed_port = _extract_host_port(token)
+        if parsed_port is not None:
+            ports[service] = parsed_port
     return ports
 
 
 def detect_source_kind(source_dir: Path) -> SourceKind:
-    compose_path = find_compose_file(source_dir)
-    dockerfile_path = source_dir / "Dockerfile"
-    if compose_path is not None:
+    compose_name, dockerfile_found = _scan_source_dir(source_dir)
+    if compose_name is not None:
         return SourceKind.COMPOSE
-    if dockerfile_path.exists() and dockerfile_path.is_file():
+    if dockerfile_found:
         return SourceKind.DOCKERFILE
     raise ValueError(
         f"{source_dir} does not contain docker-compose.yml/compose.yml or Dockerfile."
@@ -564,6 +558,9 @@ def default_base_dir() -> Path:
 
 @dataclass(frozen=True)
 class Config:
+    # Derived values that take more than a field read are cached_property:
+    # the instance is frozen, and __post_init__ finishes normalising fields
+    # before it reads any of them, so a cached value never goes stale.
     service_name: str
     source_dir: Path
     source_kind: SourceKind = SourceKind.AUTO
@@ -575,6 +572,7 @@ class Config:
     ingress_mode: IngressMode = IngressMode.MANAGED
     registry_retries: int = 4
     retry_backoff_seconds: int = 5
+    retry_backoff_max_seconds: int = 60
     tune_docker_daemon: bool = True
     compose_services: Optional[Tuple[str, ...]] = None
     domain: Optional[str] = None
@@ -592,22 +590,9 @@ class Config:
                 f"service_name={self.service_name!r} is invalid. "
                 "Use letters, numbers, '.', '_', '-'."
             )
-        if not self.source_dir.exists() or not self.source_dir.is_dir():
-            raise ValueError(f"source_dir={self.source_dir!s} must be an existing directory.")
-
-        resolved_kind = self.source_kind
-        if resolved_kind == SourceKind.AUTO:
-            resolved_kind = detect_source_kind(self.source_dir)
-            object.__setattr__(self, "source_kind", resolved_kind)
-
-        if resolved_kind == SourceKind.COMPOSE and self.source_compose_path is None:
-            raise ValueError("source_kind=compose requires a compose file in source_dir.")
-
-        if resolved_kind == SourceKind.DOCKERFILE and not self.source_dockerfile_path.exists():
-            raise ValueError("source_kind=dockerfile requires source_dir/Dockerfile.")
-        if resolved_kind == SourceKind.DOCKERFILE and self.compose_services:
-            raise ValueError("compose_services can only be set for compose sources.")
 
+        # Plain argument checks come first so bad input fails before any
+        # filesystem probing of source_dir.
         has_host = self.host_port is not None
         has_container = self.container_port is not None
         if has_host != has_container:
@@ -627,6 +612,24 @@ class Config:
             raise ValueError("registry_retries must be >= 1.")
         if self.retry_backoff_seconds < 1:
             raise ValueError("retry_backoff_seconds must be >= 1.")
+        if self.retry_backoff_max_seconds < self.retry_backoff_seconds:
+            raise ValueError("retry_backoff_max_seconds must be >= retry_backoff_seconds.")
+
+        if not self.source_dir.is_dir():
+            raise ValueError(f"source_dir={self.source_dir!s} must be an existing directory.")
+
+        resolved_kind = self.source_kind
+        if resolved_kind == SourceKind.AUTO:
+            resolved_kind = detect_source_kind(self.source_dir)
+            object.__setattr__(self, "source_kind", resolved_kind)
+
+        if resolved_kind == SourceKind.COMPOSE and self.source_compose_path is None:
+            raise ValueError("source_kind=compose requires a compose file in source_dir.")
+
+        if resolved_kind == SourceKind.DOCKERFILE and not has_dockerfile(self.source_dir):
+            raise ValueError("source_kind=dockerfile requires source_dir/Dockerfile.")
+        if resolved_kind == SourceKind.DOCKERFILE and self.compose_services:
+            raise ValueError("compose_services can only be set for compose sources.")
 
         if self.compose_services is not None:
             normalized: List[str] = []
@@ -639,7 +642,7 @@ class Config:
             object.__setattr__(self, "compose_services", tuple(normalized))
 
             if resolved_kind == SourceKind.COMPOSE and self.source_compose_path is not None:
-                known_services = set(list_compose_services(self.source_compose_path))
+                known_services = compose_service_names(self.source_compose_path)
                 if known_services:
                     unknown = [s for s in normalized if s not in known_services]
                     if unknown:
@@ -765,7 +768,7 @@ class Config:
                     "Use letters, numbers, '.', '_', '-'."
                 )
             if resolved_kind == SourceKind.COMPOSE and self.proxy_upstream_service:
-                known = set(list_compose_services(self.source_compose_path or Path("/__none__")))
+                known = compose_service_names(self.source_compose_path or Path("/__none__"))
                 if known and self.proxy_upstream_service not in known:
                     raise ValueError(
                         "proxy_upstream_service must be one of: "
@@ -779,8 +782,8 @@ class Config:
                         "proxy_upstream_service must be included in compose_services."
                     )
             if self.proxy_routes:
-                known_services = set(
-                    list_compose_services(self.source_compose_path or Path("/__none__"))
+                known_services = compose_service_names(
+                    self.source_compose_path or Path("/__none__")
                 )
                 for route in self.proxy_routes:
                     if self.tls_enabled and not _DOMAIN_RE.fullmatch(route.host):
@@ -846,10 +849,12 @@ class Config:
     def service_dir(self) -> Path:
         return self.base_dir / self.service_name
 
-    @property
+    @cached_property
     def compose_project_name(self) -> str:
         # Docker Compose project names are lowercase and limited charset.
-        normalized = re.sub(r"[^a-z0-9_-]", "-", self.service_name.lower())
+        # _SERVICE_NAME_RE already limits names to [A-Za-z0-9_.-]; '.' is the
+        # only character left to replace once lowercased.
+        normalized = self.service_name.lower().replace(".", "-")
         normalized = normalized.strip("-_")
         return normalized or "service"
 
@@ -877,6 +882,10 @@ class Config:
     def managed_nginx_conf_path(self) -> Path:
         return self.service_dir / "nginx" / "default.conf"
 
+    @property
+    def managed_nginx_proxy_common_path(self) -> Path:
+        return self.service_dir / "nginx" / "proxy_common.conf"
+
     @property
     def host_nginx_site_name(self) -> str:
         return f"deploy_wizard_{self.compose_project_name}.conf"
@@ -889,6 +898,10 @@ class Config:
     def host_nginx_site_enabled_path(self) -> Path:
         return Path("/etc/nginx/sites-enabled") / self.host_nginx_site_name
 
+    @property
+    def host_nginx_proxy_common_path(self) -> Path:
+        return Path("/etc/nginx/snippets") / "deploy_wizard_proxy_common.conf"
+
     @property
     def host_certbot_webroot_path(self) -> Path:
         return self.service_dir / "certbot-www-host"
@@ -901,7 +914,7 @@ class Config:
     def tls_enabled(self) -> bool:
         return self.domain is not None
 
-    @property
+    @cached_property
     def reverse_proxy_enabled(self) -> bool:
         return (
             self.tls_enabled
@@ -919,7 +932,7 @@ class Config:
             return "0.0.0.0"
         return self.bind_host
 
-    @property
+    @cached_property
     def effective_proxy_routes(self) -> Tuple[ProxyRoute, ...]:
         if not self.reverse_proxy_enabled:
             raise ValueError("No routes without proxy mode.")
@@ -948,19 +961,19 @@ class Config:
             ),
         )
 
-    @property
+    @cached_property
     def cert_domain_names(self) -> Tuple[str, ...]:
         if not self.tls_enabled:
             return tuple()
-        names: List[str] = []
+        names: Dict[str, None] = {}
         if self.domain is not None:
-            names.append(self.domain)
+            names[self.domain] = None
         for route in self.effective_proxy_routes:
-            if _DOMAIN_RE.fullmatch(route.host) and route.host not in names:
-                names.append(route.host)
+            if route.host not in names and _DOMAIN_RE.fullmatch(route.host):
+                names[route.host] = None
         return tuple(names)
 
-    @property
+    @cached_property
     def effective_proxy_upstream_service(self) -> str:
         if not self.reverse_proxy_enabled:
             raise ValueError("No upstream service without proxy mode.")
@@ -982,7 +995,7 @@ class Config:
             "Set proxy_upstream_service explicitly."
         )
 
-    @property
+    @cached_property
     def effective_proxy_upstream_port(self) -> int:
         if not self.reverse_proxy_enabled:
             raise ValueError("No upstream port without proxy mode.")
@@ -6,11 +6,12 @@ from __future__ import annotations
 
 import os
 import re
+import shlex
 import signal
 import subprocess
 import sys
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Union
 
 LOG_PATH = Path("/var/log/deploy_wizard.log")
 FALLBACK_LOG_PATH = Path("./deploy_wizard.log")
@@ -55,11 +56,18 @@ def die(msg: str, code: int = 1) -> None:
 
 
 def sh(
-    cmd: str,
+    cmd: Union[str, Sequence[str]],
     *,
     check: bool = True,
     env: Optional[Dict[str, str]] = None,
+    cwd: Optional[Path] = None,
 ) -> int:
+    """
+    Run a command, streaming combined output to the console and log.
+
+    A string is run through the platform shell; an argv sequence is executed
+    directly (no shell), optionally inside `cwd`.
+    """
     try:
         from tqdm import tqdm as _tqdm
 
@@ -67,7 +75,13 @@ def sh(
     except Exception:
         write = lambda s: print(s, flush=True)  # noqa: E731
 
-    safe_cmd = redact(cmd)
+    argv: Optional[List[str]] = None
+    if isinstance(cmd, str):
+        display = cmd
+    else:
+        argv = [str(part) for part in cmd]
+        display = " ".join(shlex.quote(part) for part in argv)
+    safe_cmd = redact(display)
     write(f"\n$ {safe_cmd}")
     log_line(f"\n$ {safe_cmd}")
 
@@ -78,6 +92,7 @@ def sh(
         encoding="utf-8",
         errors="replace",
         env=env,
+        cwd=str(cwd) if cwd is not None else None,
     )
     if os.name == "nt":
         popen_kwargs["args"] = ["powershell", "-NoProfile", "-Command", cmd]
@@ -85,8 +100,18 @@ def sh(
     else:
         popen_kwargs["args"] = ["bash", "-lc", cmd]
         popen_kwargs["preexec_fn"] = os.setsid
+    if argv is not None:
+        popen_kwargs["args"] = argv
 
-    proc = subprocess.Popen(**popen_kwargs)
+    try:
+        proc = subprocess.Popen(**popen_kwargs)
+    except FileNotFoundError as exc:
+        # Mirror the shell's "command not found" exit status for argv commands.
+        write(f"[ERROR] {exc}")
+        log_line(f"[ERROR] {exc}")
+        if check:
+            die(f"Command failed (exit 127): {safe_cmd}")
+        return 127
 
     try:
         assert proc.stdout is not None
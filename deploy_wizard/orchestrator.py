@@ -182,8 +182,10 @@ def _print_summary(cfg, *, tailscale_url: str = "") -> None:
             print(
                 "Proxy routes : "
                 + ", ".join(
-                    f"{r.host}{r.path_prefix}->{r.upstream_host}:{r.upstream_port}"
-                    for r in cfg.proxy_routes
+                    [
+                        f"{r.host}{r.path_prefix}->{r.upstream_host}:{r.upstream_port}"
+                        for r in cfg.proxy_routes
+                    ]
                 )
             )
     if cfg.source_kind.value == "compose":
@@ -7,14 +7,17 @@ from __future__ import annotations
 import base64
 import json
 import os
+import random
 import shutil
 import subprocess
 import socket
+import struct
 import time
 import re
+from functools import lru_cache
 from pathlib import Path
 from shlex import quote
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 
 from deploy_wizard.config import (
     AccessMode,
@@ -26,12 +29,81 @@ from deploy_wizard.config import (
 )
 from deploy_wizard.log import die, log_line, sh
 
+# Shared proxy directives included by every generated location block.  The same
+# path is used for the managed nginx container (bind-mounted) and host nginx.
+_PROXY_COMMON_INCLUDE = "/etc/nginx/snippets/deploy_wizard_proxy_common.conf"
+_PROXY_COMMON = (
+    "proxy_http_version 1.1;\n"
+    "proxy_set_header Host $host;\n"
+    "proxy_set_header X-Real-IP $remote_addr;\n"
+    "proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;\n"
+    "proxy_set_header X-Forwarded-Proto $scheme;\n"
+)
+
+_IOV_MAX = 1024
+_IPV4_RE = re.compile(r"\d{1,3}(?:\.\d{1,3}){3}")
+
 
 def write_file(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(content, encoding="utf-8")
 
 
+def _writev_all(fd: int, buffers: List[bytes]) -> None:
+    if not hasattr(os, "writev"):
+        # Windows has no writev(); join once and loop over short writes.
+        data = memoryview(b"".join(buffers))
+        while data:
+            data = data[os.write(fd, data):]
+        return
+    while buffers:
+        written = os.writev(fd, buffers[:_IOV_MAX])
+        # Drop fully written buffers and trim a partially written one.
+        while buffers and written >= len(buffers[0]):
+            written -= len(buffers[0])
+            buffers.pop(0)
+        if written:
+            buffers[0] = buffers[0][written:]
+
+
+def _atomic_write_all(entries: List[Tuple[Path, List[bytes]]]) -> None:
+    """
+    Write a set of generated files so each file is replaced atomically: every
+    temp file is written and fsynced before any of them is renamed into place.
+    """
+    staged = []
+    try:
+        for path, chunks in entries:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.tmp")
+            staged.append((tmp, path))
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                _writev_all(fd, [chunk for chunk in chunks if chunk])
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+    except BaseException:
+        # Nothing has been renamed yet; drop every temp file staged so far.
+        for tmp, _path in staged:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        raise
+    for tmp, path in staged:
+        os.replace(tmp, path)
+    if os.name == "nt":
+        # Directories cannot be opened for fsync on Windows.
+        return
+    for parent in dict.fromkeys(path.parent for _tmp, path in staged):
+        dir_fd = os.open(parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
 def _compose_host_path(path: Path) -> str:
     text = str(path)
     if os.name == "nt":
@@ -92,7 +164,7 @@ def _first_ipv4(text: str) -> str:
         candidate = raw.strip()
         if not candidate:
             continue
-        if re.fullmatch(r"\d{1,3}(?:\.\d{1,3}){3}", candidate):
+        if _IPV4_RE.fullmatch(candidate):
             return candidate
     return ""
 
@@ -114,6 +186,7 @@ def _resolve_tailscale_ipv4_windows_fallback() -> str:
     return _first_ipv4(proc.stdout)
 
 
+@lru_cache(maxsize=1)
 def _resolve_tailscale_ipv4() -> str:
     for tailscale_cmd in _tailscale_command_candidates():
         proc = subprocess.run(
@@ -264,11 +337,16 @@ def configure_tailscale_https(cfg: Config) -> str:
 
 
 def _resolve_bind_host(cfg: Config) -> str:
-    if cfg.access_mode == AccessMode.PUBLIC:
+    return _resolve_bind_host_for(cfg.access_mode, cfg.bind_host)
+
+
+@lru_cache(maxsize=None)
+def _resolve_bind_host_for(access_mode: AccessMode, bind_host: str) -> str:
+    if access_mode == AccessMode.PUBLIC:
         return "0.0.0.0"
-    if cfg.access_mode == AccessMode.TAILSCALE:
-        if cfg.bind_host and not _is_loopback_host(cfg.bind_host):
-            return cfg.bind_host
+    if access_mode == AccessMode.TAILSCALE:
+        if bind_host and not _is_loopback_host(bind_host):
+            return bind_host
         detected = _resolve_tailscale_ipv4()
         if detected:
             return detected
@@ -277,29 +355,64 @@ def _resolve_bind_host(cfg: Config) -> str:
             "Falling back to bind host 0.0.0.0."
         )
         return "0.0.0.0"
-    return cfg.bind_host
+    return bind_host
 
 
 def _can_bind(bind_host: str, port: int) -> Tuple[bool, str]:
+    # Two-phase probe: bind+listen proves we can own the port, then a short
+    # connect proves nobody else is already accepting on it (e.g. a listener on
+    # a wildcard/other address that bind() alone does not always detect).
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     try:
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         sock.bind((bind_host, port))
-        return True, ""
-    except OSError as exc:
+        sock.listen(1)
+    except (OSError, OverflowError) as exc:
         return False, str(exc)
     finally:
         sock.close()
 
+    connect_host = "127.0.0.1" if bind_host in ("", "0.0.0.0") else bind_host
+    try:
+        conn = socket.create_connection((connect_host, port), timeout=0.2)
+    except (OSError, OverflowError):
+        return True, ""
+    # Reset instead of FIN so port sweeps don't leave TIME_WAIT entries behind.
+    conn.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+    conn.close()
+    return False, f"{connect_host}:{port} is already accepting connections"
 
-def _suggest_port(bind_host: str, start: int) -> int:
-    for candidate in range(max(1024, start), min(start + 2000, 65535) + 1):
+
+def _bind_only(bind_host: str, port: int) -> bool:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((bind_host, port))
+        return True
+    except (OSError, OverflowError):
+        return False
+    finally:
+        sock.close()
+
+
+def _first_bindable(bind_host: str, candidates: range) -> int:
+    # Sweep with a bare bind() and only run the full two-phase probe (listen +
+    # connect) on ports that pass it.
+    for candidate in candidates:
+        if not _bind_only(bind_host, candidate):
+            continue
         ok, _ = _can_bind(bind_host, candidate)
         if ok:
             return candidate
     return 0
 
 
+def _suggest_port(bind_host: str, start: int) -> int:
+    first = max(1024, start)
+    last = min(start + 2000, 65535)
+    return _first_bindable(bind_host, range(first, last + 1))
+
+
 def ensure_required_ports_available(cfg: Config) -> None:
     checks = []
     if cfg.uses_managed_ingress:
@@ -318,8 +431,14 @@ def ensure_required_ports_available(cfg: Config) -> None:
     elif cfg.source_kind == SourceKind.DOCKERFILE and cfg.host_port is not None:
         checks.append(("service host port", _resolve_bind_host(cfg), cfg.host_port, "--host-port"))
 
-    for label, bind_host, port, flag in checks:
-        ok, err = _can_bind(bind_host, int(port))
+    if not checks:
+        return
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        results = list(pool.map(lambda check: _can_bind(check[1], int(check[2])), checks))
+
+    for (label, bind_host, port, flag), (ok, err) in zip(checks, results):
         if ok:
             continue
         suggestion = _suggest_port(bind_host, 8080 if int(port) < 1024 else int(port) + 1)
@@ -330,6 +449,10 @@ def ensure_required_ports_available(cfg: Config) -> None:
 
 
 def write_generated_compose(cfg: Config) -> None:
+    _atomic_write_all([_generated_compose_entry(cfg)])
+
+
+def _generated_compose_entry(cfg: Config) -> Tuple[Path, List[bytes]]:
     ports_block = ""
     if cfg.host_port is not None and cfg.container_port is not None:
         bind_host = _resolve_bind_host(cfg)
@@ -348,13 +471,18 @@ def write_generated_compose(cfg: Config) -> None:
         "    restart: unless-stopped\n"
         f"{ports_block}"
     )
-    write_file(cfg.managed_compose_path, content)
+    return cfg.managed_compose_path, [content.encode("utf-8")]
 
 
 def write_proxy_compose(cfg: Config) -> None:
     if not cfg.uses_managed_ingress:
         return
+    _atomic_write_all([_proxy_compose_entry(cfg)])
+
+
+def _proxy_compose_entry(cfg: Config) -> Tuple[Path, List[bytes]]:
     nginx_conf = cfg.managed_nginx_conf_path
+    proxy_common = cfg.managed_nginx_proxy_common_path
     bind_host = _resolve_bind_host(cfg)
     acme_dir = cfg.service_dir / "certbot-www"
     letsencrypt_dir = cfg.service_dir / "letsencrypt"
@@ -366,7 +494,9 @@ def write_proxy_compose(cfg: Config) -> None:
         ports.append(f'      - "{bind_host}:{cfg.effective_proxy_https_port}:443"\n')
     volumes = [
         "      - "
-        f"{_yaml_quoted_volume(nginx_conf, '/etc/nginx/conf.d/default.conf:ro')}\n"
+        f"{_yaml_quoted_volume(nginx_conf, '/etc/nginx/conf.d/default.conf:ro')}\n",
+        "      - "
+        f"{_yaml_quoted_volume(proxy_common, f'{_PROXY_COMMON_INCLUDE}:ro')}\n",
     ]
     if cfg.tls_enabled:
         volumes.extend(
@@ -375,19 +505,19 @@ def write_proxy_compose(cfg: Config) -> None:
                 f"      - {_yaml_quoted_volume(letsencrypt_dir, '/etc/letsencrypt')}\n",
             ]
         )
-    content = (
+    fragments = [
         "services:\n"
         "  nginx:\n"
         "    image: nginx:1.27-alpine\n"
         f"    container_name: {cfg.compose_project_name}-nginx\n"
         "    restart: unless-stopped\n"
-        "    ports:\n"
-        f"{''.join(ports)}"
-        "    volumes:\n"
-        f"{''.join(volumes)}"
-    )
+        "    ports:\n",
+        *ports,
+        "    volumes:\n",
+        *volumes,
+    ]
     if cfg.tls_enabled:
-        content += (
+        fragments.append(
             "  certbot:\n"
             "    image: certbot/certbot:latest\n"
             '    profiles: ["manual"]\n'
@@ -395,28 +525,27 @@ def write_proxy_compose(cfg: Config) -> None:
             f"      - {_yaml_quoted_volume(acme_dir, '/var/www/certbot')}\n"
             f"      - {_yaml_quoted_volume(letsencrypt_dir, '/etc/letsencrypt')}\n"
         )
-    write_file(cfg.managed_proxy_compose_path, content)
+    return (
+        cfg.managed_proxy_compose_path,
+        [fragment.encode("utf-8") for fragment in fragments],
+    )
 
 
 def _group_routes_by_host(routes) -> list:
     grouped = {}
-    order = []
     for route in routes:
-        if route.host not in grouped:
-            grouped[route.host] = []
-            order.append(route.host)
-        grouped[route.host].append(route)
-    return [(host, grouped[host]) for host in order]
+        grouped.setdefault(route.host, []).append(route)
+    return list(grouped.items())
 
 
 def _tls_server_hosts(cfg: Config, routes) -> list:
-    hosts = []
+    # A dict keeps first-seen order with O(1) membership per host.
+    hosts = {}
     if cfg.domain:
-        hosts.append(cfg.domain)
+        hosts[cfg.domain] = None
     for route in routes:
-        if route.host not in hosts:
-            hosts.append(route.host)
-    return hosts
+        hosts.setdefault(route.host)
+    return list(hosts)
 
 
 def _render_auth_guard(auth_token: str | None) -> str:
@@ -438,6 +567,31 @@ def _render_auth_guard(auth_token: str | None) -> str:
     )
 
 
+_ROOT_LOCATION_TMPL = (
+    "    location / {{\n"
+    "{auth_guard}"
+    "        resolver 127.0.0.11 valid=10s;\n"
+    "        set ${upstream_var} http://{upstream_host}:{upstream_port};\n"
+    "        proxy_pass ${upstream_var};\n"
+    "        include {proxy_include};\n"
+    "    }}\n"
+)
+_PREFIX_LOCATION_TMPL = (
+    "    location = {prefix} {{\n"
+    "        return 301 {prefix}/;\n"
+    "    }}\n"
+    "\n"
+    "    location ^~ {prefix}/ {{\n"
+    "{auth_guard}"
+    "        resolver 127.0.0.11 valid=10s;\n"
+    "        set ${upstream_var} http://{upstream_host}:{upstream_port};\n"
+    "        proxy_pass ${upstream_var}/;\n"
+    "        include {proxy_include};\n"
+    "        proxy_set_header X-Forwarded-Prefix {prefix};\n"
+    "    }}\n"
+)
+
+
 def _render_route_locations(routes, auth_guard: str) -> str:
     # Use Docker's internal resolver (127.0.0.11) with a variable-based upstream so
     # that nginx resolves hostnames lazily at request time rather than at config-load
@@ -446,46 +600,15 @@ def _render_route_locations(routes, auth_guard: str) -> str:
     # starts — a common problem when upstreams have slow-starting dependencies.
     blocks = []
     for route in routes:
-        upstream_var = f"{route.upstream_host}_{route.upstream_port}".replace("-", "_")
-        upstream_set = (
-            "        resolver 127.0.0.11 valid=10s;\n"
-            f"        set ${upstream_var} http://{route.upstream_host}:{route.upstream_port};\n"
-        )
-        if route.path_prefix == "/":
-            blocks.append(
-                (
-                    "    location / {\n"
-                    f"{auth_guard}"
-                    f"{upstream_set}"
-                    f"        proxy_pass ${upstream_var};\n"
-                    "        proxy_http_version 1.1;\n"
-                    "        proxy_set_header Host $host;\n"
-                    "        proxy_set_header X-Real-IP $remote_addr;\n"
-                    "        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;\n"
-                    "        proxy_set_header X-Forwarded-Proto $scheme;\n"
-                    "    }\n"
-                )
-            )
-            continue
-        prefix = route.path_prefix
+        template = _ROOT_LOCATION_TMPL if route.path_prefix == "/" else _PREFIX_LOCATION_TMPL
         blocks.append(
-            (
-                f"    location = {prefix} {{\n"
-                f"        return 301 {prefix}/;\n"
-                "    }\n"
-                "\n"
-                f"    location ^~ {prefix}/ {{\n"
-                f"{auth_guard}"
-                f"{upstream_set}"
-                f"        proxy_pass ${upstream_var}/;\n"
-                "        proxy_http_version 1.1;\n"
-                "        proxy_set_header Host $host;\n"
-                "        proxy_set_header X-Real-IP $remote_addr;\n"
-                "        proxy_set_header X-Forwarded-For $proxy_add_x_forwarded_for;\n"
-                "        proxy_set_header X-Forwarded-Proto $scheme;\n"
-                "        proxy_set_header X-Forwarded-Prefix "
-                f"{prefix};\n"
-                "    }\n"
+            template.format(
+                prefix=route.path_prefix,
+                auth_guard=auth_guard,
+                upstream_var=f"{route.upstream_host}_{route.upstream_port}".replace("-", "_"),
+                upstream_host=route.upstream_host,
+                upstream_port=route.upstream_port,
+                proxy_include=_PROXY_COMMON_INCLUDE,
             )
         )
     return "\n".join(blocks).rstrip() + "\n"
@@ -607,6 +730,28 @@ def _render_https_fallback_server(
 def write_nginx_proxy_config(cfg: Config, *, https_enabled: bool) -> None:
     if not cfg.uses_managed_ingress:
         return
+    _atomic_write_all(_nginx_proxy_config_entries(cfg, https_enabled=https_enabled))
+
+
+def _nginx_proxy_config_entries(
+    cfg: Config, *, https_enabled: bool
+) -> List[Tuple[Path, List[bytes]]]:
+    blocks = _nginx_proxy_server_blocks(cfg, https_enabled=https_enabled)
+    chunks: List[bytes] = []
+    for block in blocks:
+        chunks.extend((block.encode("utf-8"), b"\n"))
+    return [
+        (cfg.managed_nginx_proxy_common_path, [_PROXY_COMMON.encode("utf-8")]),
+        (cfg.managed_nginx_conf_path, chunks or [b"\n"]),
+    ]
+
+
+def _render_nginx_proxy_config(cfg: Config, *, https_enabled: bool) -> str:
+    blocks = _nginx_proxy_server_blocks(cfg, https_enabled=https_enabled)
+    return "\n".join(blocks) + "\n"
+
+
+def _nginx_proxy_server_blocks(cfg: Config, *, https_enabled: bool) -> List[str]:
     routes = cfg.effective_proxy_routes
     cert_base_domain = cfg.domain or ""
     auth_guard = _render_auth_guard(cfg.auth_token)
@@ -667,8 +812,7 @@ def write_nginx_proxy_config(cfg: Config, *, https_enabled: bool) -> None:
                     cert_base_domain=cert_base_domain,
                 )
             )
-    content = "\n".join(blocks) + "\n"
-    write_file(cfg.managed_nginx_conf_path, content)
+    return blocks
 
 
 def _compose_workdir(cfg: Config) -> Path:
@@ -677,7 +821,7 @@ def _compose_workdir(cfg: Config) -> Path:
     return cfg.service_dir
 
 
-def _compose_prefix(cfg: Config) -> str:
+def _compose_prefix(cfg: Config) -> List[str]:
     if cfg.source_kind == SourceKind.COMPOSE:
         base_compose = cfg.source_compose_path
     else:
@@ -687,13 +831,10 @@ def _compose_prefix(cfg: Config) -> str:
     files = [base_compose]
     if cfg.uses_managed_ingress:
         files.append(cfg.managed_proxy_compose_path)
-    files_part = " ".join(f"-f {quote(str(path))}" for path in files)
-    return f"docker compose -p {quote(cfg.compose_project_name)} {files_part}"
-
-
-def _chain_cmd(*parts: str) -> str:
-    sep = " ; " if os.name == "nt" else " && "
-    return sep.join(part for part in parts if part)
+    argv = ["docker", "compose", "-p", cfg.compose_project_name]
+    for path in files:
+        argv.extend(["-f", str(path)])
+    return argv
 
 
 def _issue_certificate(cfg: Config) -> None:
@@ -704,23 +845,23 @@ def _issue_certificate(cfg: Config) -> None:
         die("No certificate domains configured for certbot.")
     primary_domain = domains[0]
     certbot_email = cfg.certbot_email or ""
-    domains_arg = " ".join(f"-d {quote(name)}" for name in domains)
-    cmd = _chain_cmd(
-        f"cd {quote(str(_compose_workdir(cfg)))}",
-        (
-            f"{_compose_prefix(cfg)} run --rm certbot "
-            f"certonly --webroot -w /var/www/certbot "
-            f"--cert-name {quote(primary_domain)} --expand "
-            f"--agree-tos --non-interactive --no-eff-email "
-            f"--email {quote(certbot_email)} "
-            f"{domains_arg} "
-            "--keep-until-expiring"
-        ),
-    )
+    argv = [
+        *_compose_prefix(cfg),
+        "run", "--rm", "certbot",
+        "certonly", "--webroot", "-w", "/var/www/certbot",
+        "--cert-name", primary_domain, "--expand",
+        "--agree-tos", "--non-interactive", "--no-eff-email",
+        "--email", certbot_email,
+    ]
+    for name in domains:
+        argv.extend(["-d", name])
+    argv.append("--keep-until-expiring")
     if not _run_with_retries(
-        cmd,
+        argv,
+        cwd=_compose_workdir(cfg),
         attempts=cfg.registry_retries,
         backoff_seconds=cfg.retry_backoff_seconds,
+        max_backoff_seconds=cfg.retry_backoff_max_seconds,
         context="certbot certificate issuance",
     ):
         die(
@@ -730,18 +871,31 @@ def _issue_certificate(cfg: Config) -> None:
         )
 
 
+def _nginx_running(cfg: Config) -> bool:
+    try:
+        proc = _run_capture(
+            [
+                "docker", "inspect", "-f", "{{.State.Running}}",
+                f"{cfg.compose_project_name}-nginx",
+            ]
+        )
+    except FileNotFoundError:
+        return False
+    return proc.returncode == 0 and proc.stdout.strip() == "true"
+
+
 def _reload_nginx(cfg: Config) -> None:
     if not cfg.uses_managed_ingress:
         return
-    workdir = quote(str(_compose_workdir(cfg)))
+    workdir = _compose_workdir(cfg)
     prefix = _compose_prefix(cfg)
-    reload_cmd = _chain_cmd(f"cd {workdir}", f"{prefix} exec -T nginx nginx -s reload")
-    if sh(reload_cmd, check=False) == 0:
-        return
-    up_cmd = _chain_cmd(f"cd {workdir}", f"{prefix} up -d nginx")
-    if sh(up_cmd, check=False) != 0:
+    reload_argv = [*prefix, "exec", "-T", "nginx", "nginx", "-s", "reload"]
+    if _nginx_running(cfg):
+        if sh(reload_argv, check=False, cwd=workdir) == 0:
+            return
+    if sh([*prefix, "up", "-d", "nginx"], check=False, cwd=workdir) != 0:
         die("Failed to start nginx container for TLS reload.")
-    if sh(reload_cmd, check=False) != 0:
+    if sh(reload_argv, check=False, cwd=workdir) != 0:
         die("Failed to reload nginx after updating TLS configuration.")
 
 
@@ -817,9 +971,9 @@ def _render_host_nginx_config(cfg: Config, *, https_enabled: bool) -> str:
 def _activate_host_nginx_site(cfg: Config, content: str) -> None:
     available = cfg.host_nginx_site_available_path
     enabled = cfg.host_nginx_site_enabled_path
-    available.parent.mkdir(parents=True, exist_ok=True)
     enabled.parent.mkdir(parents=True, exist_ok=True)
-    available.write_text(content, encoding="utf-8")
+    write_file(cfg.host_nginx_proxy_common_path, _PROXY_COMMON)
+    write_file(available, content)
 
     if enabled.exists() or enabled.is_symlink():
         if enabled.is_symlink() and Path(enabled.resolve()) == available:
@@ -857,6 +1011,7 @@ def _issue_certificate_host(cfg: Config) -> None:
         cmd,
         attempts=cfg.registry_retries,
         backoff_seconds=cfg.retry_backoff_seconds,
+        max_backoff_seconds=cfg.retry_backoff_max_seconds,
         context="host certbot certificate issuance",
     ):
         die(
@@ -884,26 +1039,39 @@ def _configure_host_nginx_ingress(cfg: Config) -> None:
         _reload_or_start_host_nginx(cfg)
 
 
+def _finalize_managed_tls(cfg: Config) -> None:
+    # Only write the HTTPS config once the certificate exists so a restarting
+    # nginx never loads missing cert paths.
+    _issue_certificate(cfg)
+    content = _render_nginx_proxy_config(cfg, https_enabled=True)
+    _atomic_write_all([(cfg.managed_nginx_conf_path, [content.encode("utf-8")])])
+    _reload_nginx(cfg)
+
+
 def _run_with_retries(
-    cmd: str,
+    cmd: Union[str, List[str]],
     *,
+    cwd: Optional[Path] = None,
     attempts: int,
     backoff_seconds: int,
+    max_backoff_seconds: int = 60,
     context: str,
 ) -> bool:
     """
-    Retry transient docker/registry failures with exponential backoff.
+    Retry transient docker/registry failures with capped, jittered exponential backoff.
     """
     for attempt in range(1, attempts + 1):
-        rc = sh(cmd, check=False)
+        rc = sh(cmd, check=False, cwd=cwd)
         if rc == 0:
             return True
         if attempt == attempts:
             break
-        delay = backoff_seconds * (2 ** (attempt - 1))
+        delay = min(max_backoff_seconds, backoff_seconds * (2 ** (attempt - 1)))
+        # Jitter so concurrent deploys don't retry a flaky registry in lockstep.
+        delay *= random.uniform(0.8, 1.2)
         msg = (
             f"[RETRY] {context} failed (attempt {attempt}/{attempts}, exit={rc}). "
-            f"Retrying in {delay}s..."
+            f"Retrying in {delay:.1f}s..."
         )
         print(msg, flush=True)
         log_line(msg)
@@ -911,6 +1079,13 @@ def _run_with_retries(
     return False
 
 
+def _managed_ingress_entries(cfg: Config) -> List[Tuple[Path, List[bytes]]]:
+    return [
+        _proxy_compose_entry(cfg),
+        *_nginx_proxy_config_entries(cfg, https_enabled=False),
+    ]
+
+
 def deploy_compose_source(cfg: Config) -> None:
     compose_path = cfg.source_compose_path
     if compose_path is None:
@@ -920,7 +1095,7 @@ def deploy_compose_source(cfg: Config) -> None:
         dotenv_path=cfg.source_dir / ".env",
     )
     if missing_env:
-        names = ", ".join(name for name, _requires_non_empty in missing_env)
+        names = ", ".join([name for name, _requires_non_empty in missing_env])
         die(
             "Compose file has unset/empty interpolation variables: "
             f"{names}. "
@@ -931,28 +1106,22 @@ def deploy_compose_source(cfg: Config) -> None:
     if cfg.compose_services:
         services.extend(cfg.compose_services)
     if cfg.uses_managed_ingress:
-        write_proxy_compose(cfg)
-        write_nginx_proxy_config(cfg, https_enabled=False)
+        _atomic_write_all(_managed_ingress_entries(cfg))
         if cfg.compose_services and "nginx" not in services:
             services.append("nginx")
-    services_arg = ""
-    if services:
-        services_arg = " " + " ".join(quote(s) for s in services)
-    workdir = quote(str(_compose_workdir(cfg)))
+    workdir = _compose_workdir(cfg)
     prefix = _compose_prefix(cfg)
     # Stop and remove any existing containers before deploying.  `rm -sf` stops
     # running containers first (-s), then force-removes them (-f).  Without -s,
     # running containers are silently skipped and the subsequent `compose up`
     # fails with a "container name already in use" conflict.
-    sh(_chain_cmd(f"cd {workdir}", f"{prefix} rm -sf{services_arg}"), check=False)
-    cmd = _chain_cmd(
-        f"cd {workdir}",
-        f"{prefix} up -d --build --remove-orphans{services_arg}",
-    )
+    sh([*prefix, "rm", "-sf", *services], check=False, cwd=workdir)
     if not _run_with_retries(
-        cmd,
+        [*prefix, "up", "-d", "--build", "--remove-orphans", *services],
+        cwd=workdir,
         attempts=cfg.registry_retries,
         backoff_seconds=cfg.retry_backoff_seconds,
+        max_backoff_seconds=cfg.retry_backoff_max_seconds,
         context="compose deploy",
     ):
         die(
@@ -960,32 +1129,28 @@ def deploy_compose_source(cfg: Config) -> None:
             "This is usually caused by registry/network instability."
         )
     if cfg.uses_managed_ingress and cfg.tls_enabled:
-        _issue_certificate(cfg)
-        write_nginx_proxy_config(cfg, https_enabled=True)
-        _reload_nginx(cfg)
+        _finalize_managed_tls(cfg)
     elif cfg.reverse_proxy_enabled and cfg.ingress_mode != IngressMode.MANAGED:
         _configure_host_nginx_ingress(cfg)
 
 
 def deploy_dockerfile_source(cfg: Config) -> None:
-    write_generated_compose(cfg)
-    services = cfg.service_key
+    batch = [_generated_compose_entry(cfg)]
+    services = [cfg.service_key]
     if cfg.uses_managed_ingress:
-        write_proxy_compose(cfg)
-        write_nginx_proxy_config(cfg, https_enabled=False)
-        services = f"{cfg.service_key} nginx"
-    workdir = quote(str(_compose_workdir(cfg)))
+        batch.extend(_managed_ingress_entries(cfg))
+        services.append("nginx")
+    _atomic_write_all(batch)
+    workdir = _compose_workdir(cfg)
     prefix = _compose_prefix(cfg)
     # Pre-flight cleanup — same reasoning as in deploy_compose_source.
-    sh(_chain_cmd(f"cd {workdir}", f"{prefix} rm -sf {services}"), check=False)
-    cmd = _chain_cmd(
-        f"cd {workdir}",
-        f"{prefix} up -d --build --remove-orphans {services}",
-    )
+    sh([*prefix, "rm", "-sf", *services], check=False, cwd=workdir)
     if not _run_with_retries(
-        cmd,
+        [*prefix, "up", "-d", "--build", "--remove-orphans", *services],
+        cwd=workdir,
         attempts=cfg.registry_retries,
         backoff_seconds=cfg.retry_backoff_seconds,
+        max_backoff_seconds=cfg.retry_backoff_max_seconds,
         context="dockerfile deploy",
     ):
         die(
@@ -993,9 +1158,7 @@ def deploy_dockerfile_source(cfg: Config) -> None:
             "This is usually caused by registry/network instability."
         )
     if cfg.uses_managed_ingress and cfg.tls_enabled:
-        _issue_certificate(cfg)
-        write_nginx_proxy_config(cfg, https_enabled=True)
-        _reload_nginx(cfg)
+        _finalize_managed_tls(cfg)
     elif cfg.reverse_proxy_enabled and cfg.ingress_mode != IngressMode.MANAGED:
         _configure_host_nginx_ingress(cfg)
 
@@ -8,12 +8,14 @@ import json
 import os
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
 from deploy_wizard.log import die, log_line, sh
 
 _FALLBACK_DNS = ("1.1.1.1", "8.8.8.8")
+_DAEMON_JSON_PATH = Path("/etc/docker/daemon.json")
 
 
 def _is_loopback_dns(value: str) -> bool:
@@ -28,22 +30,31 @@ def _normalize_dns_entries(raw: Any) -> List[str]:
     else:
         values = [raw]
 
-    out: List[str] = []
+    # Dict keys dedupe in one pass while keeping first-seen order.
+    out: Dict[str, None] = {}
     for item in values:
         value = str(item).strip()
-        if not value or _is_loopback_dns(value):
-            continue
-        if value not in out:
-            out.append(value)
-    return out
+        if value and not _is_loopback_dns(value):
+            out[value] = None
+    return list(out)
 
 
 def _merged_dns(raw: Any) -> List[str]:
-    merged = _normalize_dns_entries(raw)
-    for fallback in _FALLBACK_DNS:
-        if fallback not in merged:
-            merged.append(fallback)
-    return merged
+    return list(dict.fromkeys([*_normalize_dns_entries(raw), *_FALLBACK_DNS]))
+
+
+@lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    return shutil.which(name)
+
+
+@lru_cache(maxsize=1)
+def _docker_compose_ok() -> bool:
+    return subprocess.run(
+        ["docker", "compose", "version"],
+        capture_output=True,
+        check=False,
+    ).returncode == 0
 
 
 def require_root_reexec() -> None:
@@ -51,7 +62,7 @@ def require_root_reexec() -> None:
         return
     if os.geteuid() == 0:
         return
-    if shutil.which("sudo") is None:
+    if _which("sudo") is None:
         die("Must run as root (sudo not found).")
     import sys
 
@@ -73,10 +84,14 @@ def detect_ubuntu() -> None:
 def ensure_base_packages() -> None:
     if os.name == "nt":
         return
-    sh("export DEBIAN_FRONTEND=noninteractive; apt-get update -y")
+    env = {**os.environ, "DEBIAN_FRONTEND": "noninteractive"}
+    sh(["apt-get", "update", "-y"], env=env)
     sh(
-        "export DEBIAN_FRONTEND=noninteractive; "
-        "apt-get install -y ca-certificates curl gnupg"
+        [
+            "apt-get", "install", "-y", "--no-install-recommends",
+            "ca-certificates", "curl", "gnupg",
+        ],
+        env=env,
     )
 
 
@@ -90,17 +105,14 @@ def ensure_nginx_and_certbot() -> None:
 
 
 def ensure_docker() -> None:
-    if shutil.which("docker"):
-        rc = subprocess.run(
-            ["docker", "compose", "version"],
-            capture_output=True,
-            check=False,
-        ).returncode
-        if rc == 0:
-            return
+    if _which("docker") and _docker_compose_ok():
+        return
     if os.name == "nt":
         die("Docker Compose v2 not found. Install Docker Desktop and ensure `docker compose` works.")
     sh("curl -fsSL https://get.docker.com | bash")
+    # The install changes both answers; drop the cached negatives.
+    _which.cache_clear()
+    _docker_compose_ok.cache_clear()
 
 
 def ensure_docker_daemon_tuning() -> None:
@@ -114,28 +126,40 @@ def ensure_docker_daemon_tuning() -> None:
         log_line("[DOCKER] daemon tuning skipped on Windows.")
         return
 
-    daemon_path = Path("/etc/docker/daemon.json")
+    daemon_path = _DAEMON_JSON_PATH
+    existing: Optional[bytes] = daemon_path.read_bytes() if daemon_path.exists() else None
     current: dict = {}
-    if daemon_path.exists():
+    if existing is not None:
         try:
-            current = json.loads(daemon_path.read_text(encoding="utf-8"))
+            current = json.loads(existing.decode("utf-8"))
         except Exception:
             current = {}
+        if not isinstance(current, dict):
+            current = {}
 
     merged = dict(current)
     merged["max-concurrent-downloads"] = 1
     merged["max-concurrent-uploads"] = 1
     merged["dns"] = _merged_dns(merged.get("dns"))
 
+    # _merged_dns is idempotent, so a previously tuned file compares equal here
+    # and never triggers a docker restart.
     if merged == current:
         return
 
     daemon_path.parent.mkdir(parents=True, exist_ok=True)
-    if daemon_path.exists():
+    if existing is not None:
         backup = daemon_path.with_suffix(".json.bak")
-        backup.write_text(daemon_path.read_text(encoding="utf-8"), encoding="utf-8")
+        backup.write_bytes(existing)
         log_line(f"[DOCKER] Backed up daemon config: {backup}")
-    daemon_path.write_text(json.dumps(merged, indent=2) + "\n", encoding="utf-8")
+    # Write, fsync, then rename so an interrupted run never leaves a truncated
+    # daemon.json.
+    tmp = daemon_path.with_suffix(".json.tmp")
+    with tmp.open("wb") as fh:
+        fh.write((json.dumps(merged, indent=2) + "\n").encode("utf-8"))
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, daemon_path)
     log_line("[DOCKER] Updated daemon.json with registry retry hardening.")
     sh("systemctl restart docker")
 
@@ -4,31 +4,61 @@ Interactive wizard for generic service deployment.
 
 from __future__ import annotations
 
+import os
 import re
 import socket
+import stat
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from deploy_wizard.config import (
     AccessMode,
     Config,
     IngressMode,
+    ProxyRoute,
     parse_proxy_route,
     SourceKind,
     detect_source_kind,
     find_compose_file,
+    has_dockerfile,
     list_missing_compose_env_vars,
     list_compose_service_host_ports,
     list_compose_service_ports,
     list_compose_services,
 )
 
+if sys.stdin is not None and sys.stdin.isatty():
+    # Importing readline gives input() line editing and in-session history.
+    # Piped/test stdin gets plain input() without the terminal setup.
+    try:
+        import readline  # noqa: F401
+    except ImportError:  # Windows and minimal Python builds
+        pass
+
+_SERVICE_KEY_RE = re.compile(r"[^a-z0-9_-]")
+_SERVICE_KEY_TRANS = str.maketrans(
+    {
+        chr(code): "-"
+        for code in range(128)
+        if chr(code) not in "abcdefghijklmnopqrstuvwxyz0123456789_-"
+    }
+)
+_PATH_SEG_RE = re.compile(r"[^a-z0-9._~-]+")
+# Dashes are folded into the invalid class so runs of them collapse in one pass.
+_SUBDOMAIN_RE = re.compile(r"[^a-z0-9]+")
+_DOTENV_SAFE_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_./:@+-"
+)
+_DOTENV_LINE_RE = re.compile(r"\s*(export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=")
+_YES_ANSWERS = frozenset({"y", "yes", "yeah", "yep"})
+
 
 def _prompt(msg: str, default: str = "") -> str:
-    suffix = f" [{default}]" if default else ""
+    prompt = f"{msg} [{default}]: " if default else f"{msg}: "
     try:
-        value = input(f"{msg}{suffix}: ").strip()
+        value = input(prompt).strip()
     except (EOFError, KeyboardInterrupt):
         print()
         sys.exit(0)
@@ -36,73 +66,79 @@ def _prompt(msg: str, default: str = "") -> str:
 
 
 def _prompt_int(msg: str, default: int, min_val: int = 1, max_val: int = 65535) -> int:
+    err_msg = f"Please enter a number between {min_val} and {max_val}."
     while True:
         raw = _prompt(msg, str(default))
-        try:
-            value = int(raw)
-            if min_val <= value <= max_val:
-                return value
-        except ValueError:
-            pass
-        print(f"Please enter a number between {min_val} and {max_val}.")
+        # isdecimal() (unlike isdigit()) only admits characters int() accepts.
+        if raw.isdecimal() and min_val <= int(raw) <= max_val:
+            return int(raw)
+        print(err_msg)
 
 
 def _confirm(msg: str, default: bool = True) -> bool:
     hint = "Y/n" if default else "y/N"
-    raw = _prompt(f"{msg} ({hint})", "").lower()
+    raw = _prompt(f"{msg} ({hint})", "")
     if not raw:
         return default
-    return raw in ("y", "yes")
+    # Only lowercase answers that aren't already an exact match.
+    return raw in _YES_ANSWERS or raw.lower() in _YES_ANSWERS
 
 
 def _choose(options: List[Tuple[str, str]], default: int = 1) -> int:
     for idx, (name, desc) in enumerate(options, 1):
         print(f"  [{idx}] {name} - {desc}")
+    err_msg = f"Please enter a number between 1 and {len(options)}."
     while True:
         raw = _prompt("Choice", str(default))
-        try:
-            value = int(raw)
-            if 1 <= value <= len(options):
-                return value
-        except ValueError:
-            pass
-        print(f"Please enter a number between 1 and {len(options)}.")
+        if raw.isdecimal() and 1 <= int(raw) <= len(options):
+            return int(raw)
+        print(err_msg)
+
+
+_ACCESS_MODE_OPTIONS = [
+    (AccessMode.LOCALHOST.value, "Bind to loopback only"),
+    (AccessMode.TAILSCALE.value, "Bind to Tailscale interface IP"),
+    (AccessMode.PUBLIC.value, "Bind to all interfaces (0.0.0.0)"),
+]
+
+_INGRESS_MODE_OPTIONS = [
+    (IngressMode.MANAGED.value, "Managed docker nginx + certbot"),
+    (IngressMode.EXTERNAL_NGINX.value, "Use existing host nginx + certbot"),
+    (IngressMode.TAKEOVER.value, "Stop/start host nginx during reconfigure"),
+]
 
 
 def _choose_access_mode() -> AccessMode:
-    options = [
-        (AccessMode.LOCALHOST.value, "Bind to loopback only"),
-        (AccessMode.TAILSCALE.value, "Bind to Tailscale interface IP"),
-        (AccessMode.PUBLIC.value, "Bind to all interfaces (0.0.0.0)"),
-    ]
-    idx = _choose(options, default=1)
-    return AccessMode(options[idx - 1][0])
+    idx = _choose(_ACCESS_MODE_OPTIONS, default=1)
+    return AccessMode(_ACCESS_MODE_OPTIONS[idx - 1][0])
 
 
 def _choose_ingress_mode() -> IngressMode:
-    options = [
-        (IngressMode.MANAGED.value, "Managed docker nginx + certbot"),
-        (IngressMode.EXTERNAL_NGINX.value, "Use existing host nginx + certbot"),
-        (IngressMode.TAKEOVER.value, "Stop/start host nginx during reconfigure"),
-    ]
-    idx = _choose(options, default=1)
-    return IngressMode(options[idx - 1][0])
+    idx = _choose(_INGRESS_MODE_OPTIONS, default=1)
+    return IngressMode(_INGRESS_MODE_OPTIONS[idx - 1][0])
 
 
+@lru_cache(maxsize=256)
 def _default_service_key(service_name: str) -> str:
-    normalized = re.sub(r"[^a-z0-9_-]", "-", service_name.lower())
+    lowered = service_name.lower()
+    # The table only covers ASCII; anything else goes through the regex.
+    if lowered.isascii():
+        normalized = lowered.translate(_SERVICE_KEY_TRANS)
+    else:
+        normalized = _SERVICE_KEY_RE.sub("-", lowered)
     normalized = normalized.strip("-_")
     return normalized or "service"
 
 
+@lru_cache(maxsize=256)
 def _default_route_path_segment(name: str) -> str:
-    token = re.sub(r"[^a-z0-9._~-]+", "-", name.lower()).strip("-")
+    token = _PATH_SEG_RE.sub("-", name.lower()).strip("-")
     return token or "service"
 
 
+@lru_cache(maxsize=256)
 def _default_subdomain_label(name: str) -> str:
-    token = re.sub(r"[^a-z0-9-]+", "-", name.lower()).strip("-")
-    token = re.sub(r"-+", "-", token)
+    token = _SUBDOMAIN_RE.sub("-", name.lower()).strip("-")
     if not token:
         return "service"
     return token[:63].strip("-") or "service"
@@ -114,7 +150,8 @@ def _format_route_spec(route) -> str:
     return f"{route.host}{route.path_prefix}={route.upstream_host}:{route.upstream_port}"
 
 
-def _format_route_summary(route) -> str:
+@lru_cache(maxsize=128)
+def _format_route_summary(route: ProxyRoute) -> str:
     return f"{route.host}{route.path_prefix}->{route.upstream_host}:{route.upstream_port}"
 
 
@@ -128,28 +165,37 @@ def _route_url_hint(route, *, tls_enabled: bool, default_domain: Optional[str])
     return f"{scheme}://{host}{route.path_prefix}"
 
 
+def _claim_unique_name(base: str, used: set, next_suffix: Dict[str, int]) -> str:
+    # Resume numbering where the last collision on this base stopped. The
+    # membership check stays because another service's base can equal a
+    # suffixed name (e.g. "api", "api-2", "api").
+    name = base
+    suffix = next_suffix.get(base, 2)
+    while name in used:
+        name = f"{base}-{suffix}"
+        suffix += 1
+    next_suffix[base] = suffix
+    used.add(name)
+    return name
+
+
 def _build_compose_path_routes(
     *,
     host: str,
     services: List[str],
     service_ports: dict,
-) -> Tuple[str, ...]:
-    routes: List[str] = []
+) -> Tuple[ProxyRoute, ...]:
+    routes: List[ProxyRoute] = []
     used_paths = set()
+    next_suffix: Dict[str, int] = {}
     for service in services:
         upstream_port_raw = service_ports.get(service)
         if upstream_port_raw is None:
             continue
         base = f"/{_default_route_path_segment(service)}"
-        path = base
-        suffix = 2
-        while path in used_paths:
-            path = f"{base}-{suffix}"
-            suffix += 1
-        used_paths.add(path)
-        upstream_port = int(upstream_port_raw)
-        route = parse_proxy_route(f"{host}{path}={service}:{upstream_port}")
-        routes.append(_format_route_spec(route))
+        path = _claim_unique_name(base, used_paths, next_suffix)
+        spec = f"{host}{path}={service}:{int(upstream_port_raw)}"
+        routes.append(parse_proxy_route(spec))
     return tuple(routes)
 
 
@@ -158,23 +204,18 @@ def _build_compose_subdomain_routes(
     domain: str,
     services: List[str],
     service_ports: dict,
-) -> Tuple[str, ...]:
-    routes: List[str] = []
-    used_hosts = set()
+) -> Tuple[ProxyRoute, ...]:
+    routes: List[ProxyRoute] = []
+    used_labels = set()
+    next_suffix: Dict[str, int] = {}
     for service in services:
         upstream_port_raw = service_ports.get(service)
         if upstream_port_raw is None:
             continue
-        base = f"{_default_subdomain_label(service)}.{domain}".lower()
-        host = base
-        suffix = 2
-        while host in used_hosts:
-            host = f"{_default_subdomain_label(service)}-{suffix}.{domain}".lower()
-            suffix += 1
-        used_hosts.add(host)
-        upstream_port = int(upstream_port_raw)
-        route = parse_proxy_route(f"{host}={service}:{upstream_port}")
-        routes.append(_format_route_spec(route))
+        label = _claim_unique_name(_default_subdomain_label(service), used_labels, next_suffix)
+        host = f"{label}.{domain}".lower()
+        spec = f"{host}={service}:{int(upstream_port_raw)}"
+        routes.append(parse_proxy_route(spec))
     return tuple(routes)
 
 
@@ -183,38 +224,57 @@ def _build_compose_subdomain_host_routes(
     domain: str,
     services: List[str],
     host_ports: dict,
-) -> Tuple[str, ...]:
-    routes: List[str] = []
-    used_hosts = set()
+) -> Tuple[ProxyRoute, ...]:
+    routes: List[ProxyRoute] = []
+    used_labels = set()
+    next_suffix: Dict[str, int] = {}
     for service in services:
         upstream_port_raw = host_ports.get(service)
         if upstream_port_raw is None:
             continue
-        base = f"{_default_subdomain_label(service)}.{domain}".lower()
-        host = base
-        suffix = 2
-        while host in used_hosts:
-            host = f"{_default_subdomain_label(service)}-{suffix}.{domain}".lower()
-            suffix += 1
-        used_hosts.add(host)
-        route = parse_proxy_route(f"{host}=127.0.0.1:{int(upstream_port_raw)}")
-        routes.append(_format_route_spec(route))
+        label = _claim_unique_name(_default_subdomain_label(service), used_labels, next_suffix)
+        host = f"{label}.{domain}".lower()
+        spec = f"{host}=127.0.0.1:{int(upstream_port_raw)}"
+        routes.append(parse_proxy_route(spec))
     return tuple(routes)
 
 
-def _port_available(bind_host: str, port: int) -> Tuple[bool, str]:
+# Probe results for this wizard session. Deployment re-checks every port before
+# starting containers, so a stale entry here can only affect a suggestion.
+_PORT_PROBE_CACHE: Dict[Tuple[str, int], Tuple[bool, str]] = {}
+
+
+def _new_probe_socket() -> socket.socket:
+    # SO_REUSEADDR matches how docker binds published ports, so ports that only
+    # have TIME_WAIT connections left (e.g. right after a redeploy) count as free.
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    return sock
+
+
+def _port_available(bind_host: str, port: int) -> Tuple[bool, str]:
+    key = (bind_host, port)
+    cached = _PORT_PROBE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    sock = _new_probe_socket()
     try:
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         sock.bind((bind_host, port))
-        return True, ""
+        result = (True, "")
     except OSError as exc:
-        return False, str(exc)
+        result = (False, str(exc))
     finally:
         sock.close()
+    _PORT_PROBE_CACHE[key] = result
+    return result
 
 
-def _suggest_port(bind_host: str, start: int, avoid: Optional[set] = None) -> Optional[int]:
+def _suggest_port(
+    bind_host: str,
+    start: int,
+    avoid: Optional[set] = None,
+    max_scan: int = 500,
+) -> Optional[int]:
     blocked = avoid or set()
     presets = [8080, 8081, 8088, 8888, 9000, 9443]
     for candidate in presets:
@@ -225,13 +285,28 @@ def _suggest_port(bind_host: str, start: int, avoid: Optional[set] = None) -> Op
         ok, _ = _port_available(bind_host, candidate)
         if ok:
             return candidate
-    upper = min(start + 500, 65535)
-    for candidate in range(max(1024, start), upper + 1):
-        if candidate in blocked:
-            continue
-        ok, _ = _port_available(bind_host, candidate)
-        if ok:
+    upper = min(start + max_scan, 65535)
+    # A failed bind() leaves the socket unbound, so one socket can try every
+    # candidate in the range; it is only closed once a port binds or we give up.
+    sock = _new_probe_socket()
+    try:
+        for candidate in range(max(1024, start), upper + 1):
+            if candidate in blocked:
+                continue
+            cached = _PORT_PROBE_CACHE.get((bind_host, candidate))
+            if cached is not None:
+                if cached[0]:
+                    return candidate
+                continue
+            try:
+                sock.bind((bind_host, candidate))
+            except OSError as exc:
+                _PORT_PROBE_CACHE[(bind_host, candidate)] = (False, str(exc))
+                continue
+            _PORT_PROBE_CACHE[(bind_host, candidate)] = (True, "")
             return candidate
+    finally:
+        sock.close()
     return None
 
 
@@ -247,14 +322,19 @@ def _pick_open_port(
         if port in blocked:
             print(f"Port {port} is already reserved in this deployment. Choose another port.")
             continue
+        # The user may have freed this port before retrying; probe it afresh.
+        _PORT_PROBE_CACHE.pop((bind_host, port), None)
         ok, err = _port_available(bind_host, port)
         if ok:
             return port
         print(f"Port {bind_host}:{port} is unavailable: {err}")
+        # The user is at the prompt and can simply type another port, so keep
+        # the suggestion scan short.
         suggestion = _suggest_port(
             bind_host,
             8080 if port < 1024 else port + 1,
             avoid=blocked,
+            max_scan=32,
         )
         if suggestion is not None and _confirm(f"Use suggested port {suggestion}?", default=True):
             return suggestion
@@ -270,11 +350,10 @@ def _auto_pick_port(
 ) -> int:
     blocked = avoid or set()
     if preferred not in blocked:
-        ok, _ = _port_available(bind_host, preferred)
+        ok, err = _port_available(bind_host, preferred)
         if ok:
             print(f"{label}: using {bind_host}:{preferred}")
             return preferred
-        _, err = _port_available(bind_host, preferred)
         print(f"{label}: {bind_host}:{preferred} unavailable ({err}).")
 
     suggestion = _suggest_port(
@@ -295,8 +374,9 @@ def _pick_proxy_routes(
     default_upstream: str,
     default_port: int,
     default_path_prefix: str = "/",
+    require_one: bool = False,
 ) -> Optional[Tuple[str, ...]]:
-    if not _confirm("Configure hostname-based proxy routes?", default=False):
+    if not require_one and not _confirm("Configure hostname-based proxy routes?", default=False):
         return None
     print(
         "Enter routes as <host>[/path]=<upstream>:<port>. "
@@ -328,44 +408,46 @@ def _choose_services(services: List[str]) -> Optional[Tuple[str, ...]]:
         print(f"  [{idx}] {name}")
     print("Enter comma-separated numbers or names, or press Enter to deploy all services.")
 
+    known = set(services)
     while True:
         raw = _prompt("Services", "")
         if not raw:
             return None
 
-        chosen: List[str] = []
-        tokens = [token.strip() for token in raw.split(",") if token.strip()]
+        tokens = [token for token in (part.strip() for part in raw.split(",")) if token]
+        # Ordered de-duplication; stays empty if any token is invalid.
+        chosen: Dict[str, None] = {}
         for token in tokens:
-            if token.isdigit():
+            if token.isdecimal():
                 idx = int(token)
                 if not (1 <= idx <= len(services)):
-                    chosen = []
+                    chosen.clear()
                     break
                 name = services[idx - 1]
-            else:
-                if token not in services:
-                    chosen = []
-                    break
+            elif token in known:
                 name = token
-            if name not in chosen:
-                chosen.append(name)
+            else:
+                chosen.clear()
+                break
+            chosen[name] = None
 
         if chosen:
             return tuple(chosen)
         print("Invalid selection. Use listed numbers or exact service names.")
 
 
-def _pick_source_dir() -> Tuple[Path, SourceKind]:
+def _pick_source_dir() -> Tuple[Path, SourceKind, Optional[Path], List[str]]:
+    default_dir = str(Path.cwd())
     while True:
-        raw = _prompt("Source directory", str(Path.cwd()))
+        raw = _prompt("Source directory", default_dir)
         source_dir = Path(raw).expanduser()
         if not source_dir.exists() or not source_dir.is_dir():
             print("Directory does not exist.")
             continue
 
         compose_path = find_compose_file(source_dir)
-        has_dockerfile = (source_dir / "Dockerfile").exists()
-        if compose_path and has_dockerfile:
+        dockerfile_found = has_dockerfile(source_dir)
+        if compose_path and dockerfile_found:
             print("Both docker-compose and Dockerfile found.")
             idx = _choose(
                 [
@@ -374,11 +456,15 @@ def _pick_source_dir() -> Tuple[Path, SourceKind]:
                 ],
                 default=1,
             )
-            return source_dir, (SourceKind.COMPOSE if idx == 1 else SourceKind.DOCKERFILE)
+            if idx == 1:
+                services = list_compose_services(compose_path)
+                return source_dir, SourceKind.COMPOSE, compose_path, services
+            return source_dir, SourceKind.DOCKERFILE, None, []
         if compose_path:
-            return source_dir, SourceKind.COMPOSE
-        if has_dockerfile:
-            return source_dir, SourceKind.DOCKERFILE
+            services = list_compose_services(compose_path)
+            return source_dir, SourceKind.COMPOSE, compose_path, services
+        if dockerfile_found:
+            return source_dir, SourceKind.DOCKERFILE, None, []
 
         print("No docker-compose.yml/compose.yml or Dockerfile found in this directory.")
         try:
@@ -389,48 +475,51 @@ def _pick_source_dir() -> Tuple[Path, SourceKind]:
 
 def _dotenv_quote(value: str) -> str:
     text = str(value)
-    if re.fullmatch(r"[A-Za-z0-9_./:@+\-]+", text):
+    if text and _DOTENV_SAFE_CHARS.issuperset(text):
         return text
     escaped = text.replace("\\", "\\\\").replace('"', '\\"')
     return f'"{escaped}"'
 
 
 def _upsert_dotenv_values(dotenv_path: Path, pairs: List[Tuple[str, str]]) -> None:
-    updates = {key: value for key, value in pairs}
-    lines: List[str] = []
-    if dotenv_path.exists() and dotenv_path.is_file():
-        lines = dotenv_path.read_text(encoding="utf-8").splitlines()
-
-    remaining = dict(updates)
-    rendered: List[str] = []
-    for raw in lines:
-        line = raw.rstrip("\n")
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#") or "=" not in stripped:
-            rendered.append(line)
-            continue
-
-        candidate = stripped
-        prefix = ""
-        if candidate.startswith("export "):
-            prefix = "export "
-            candidate = candidate[len("export ") :].strip()
-        key_raw, _value_raw = candidate.split("=", 1)
-        key = key_raw.strip()
-        if key in remaining:
-            rendered.append(f"{prefix}{key}={_dotenv_quote(remaining.pop(key))}")
-        else:
-            rendered.append(line)
-
-    if remaining:
-        if rendered and rendered[-1].strip():
-            rendered.append("")
-        for key, value in pairs:
-            if key in remaining:
-                rendered.append(f"{key}={_dotenv_quote(value)}")
-                remaining.pop(key)
-
-    dotenv_path.write_text("\n".join(rendered) + "\n", encoding="utf-8")
+    # Update the real file behind a symlinked .env instead of replacing the link.
+    dotenv_path = dotenv_path.resolve()
+    remaining = {key: value for key, value in pairs}
+    tmp_path = dotenv_path.with_name(f"{dotenv_path.name}.tmp")
+    existing = dotenv_path.is_file()
+    # Keep the original permissions; a new .env may hold secrets, so start at 0600.
+    mode = stat.S_IMODE(dotenv_path.stat().st_mode) if existing else 0o600
+    last_line = ""
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as out:
+            if existing:
+                with dotenv_path.open("r", encoding="utf-8") as fh:
+                    for raw in fh:
+                        line = raw.rstrip("\r\n")
+                        match = _DOTENV_LINE_RE.match(line) if remaining else None
+                        if match is not None and match.group(2) in remaining:
+                            key = match.group(2)
+                            prefix = "export " if match.group(1) else ""
+                            line = f"{prefix}{key}={_dotenv_quote(remaining.pop(key))}"
+                        out.write(f"{line}\n")
+                        last_line = line
+
+            if remaining:
+                if last_line.strip():
+                    out.write("\n")
+                # Dicts keep insertion order, so new keys are appended in pairs order.
+                out.writelines(
+                    f"{key}={_dotenv_quote(value)}\n" for key, value in remaining.items()
+                )
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, dotenv_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def _collect_missing_compose_env(compose_path: Path) -> None:
@@ -443,7 +532,7 @@ def _collect_missing_compose_env(compose_path: Path) -> None:
         return
 
     print("Compose file uses variables that are currently unset or empty:")
-    print("  " + ", ".join(name for name, _requires_non_empty in missing))
+    print("  " + ", ".join([name for name, _requires_non_empty in missing]))
     print("Provide values now; they will be written to .env in the source directory.")
 
     updates: List[Tuple[str, str]] = []
@@ -461,6 +550,52 @@ def _collect_missing_compose_env(compose_path: Path) -> None:
     print(f"Wrote {len(updates)} variable(s) to {dotenv_path}.")
 
 
+def _review_lines(cfg: Config) -> List[str]:
+    lines = [
+        "",
+        "Review",
+        f"  Service name : {cfg.service_name}",
+        f"  Source dir   : {cfg.source_dir}",
+        f"  Source kind  : {cfg.source_kind.value}",
+        f"  Base dir     : {cfg.base_dir}",
+        f"  Access mode  : {cfg.access_mode.value}",
+        f"  Ingress mode : {cfg.ingress_mode.value}",
+    ]
+    if cfg.host_port is not None:
+        lines.append(
+            f"  Port mapping : "
+            f"{cfg.effective_bind_host}:{cfg.host_port}->{cfg.container_port}"
+        )
+    else:
+        lines.append("  Port mapping : none")
+    if cfg.source_kind == SourceKind.COMPOSE and cfg.compose_services:
+        lines.append(f"  Compose svcs : {', '.join(cfg.compose_services)}")
+    elif cfg.source_kind == SourceKind.COMPOSE:
+        lines.append("  Compose svcs : all")
+    if cfg.tls_enabled:
+        lines.extend(
+            [
+                f"  Domain       : {cfg.domain}",
+                f"  TLS email    : {cfg.certbot_email}",
+                f"  Proxy ports  : "
+                f"{cfg.effective_proxy_http_port}->{cfg.effective_proxy_https_port}",
+            ]
+        )
+    elif cfg.reverse_proxy_enabled:
+        lines.append(f"  Proxy port   : {cfg.effective_proxy_http_port}")
+    if cfg.reverse_proxy_enabled:
+        lines.append(
+            f"  Proxy target : "
+            f"{cfg.effective_proxy_upstream_service}:{cfg.effective_proxy_upstream_port}"
+        )
+    if cfg.proxy_routes:
+        rendered = ", ".join([_format_route_summary(r) for r in cfg.proxy_routes])
+        lines.append(f"  Proxy routes : {rendered}")
+    lines.append(f"  Auth token   : {'enabled' if cfg.auth_token is not None else 'disabled'}")
+    lines.append("")
+    return lines
+
+
 def run_wizard() -> Config:
     print()
     print("Generic Service Deployment Wizard")
@@ -468,7 +603,9 @@ def run_wizard() -> Config:
     print()
 
     service_name = _prompt("Service name", "my-service")
-    source_dir, source_kind = _pick_source_dir()
+    source_dir, source_kind, compose_path, compose_service_names = _pick_source_dir()
+    is_compose = source_kind is SourceKind.COMPOSE
+    is_dockerfile = source_kind is SourceKind.DOCKERFILE
     base_dir = Path(_prompt("Deployment base directory", "/opt/services")).expanduser()
 
     host_port: Optional[int] = None
@@ -493,10 +630,9 @@ def run_wizard() -> Config:
     print("Access mode:")
     access_mode = _choose_access_mode()
 
-    if source_kind == SourceKind.COMPOSE:
-        compose_path = find_compose_file(source_dir)
+    if is_compose:
         if compose_path is not None:
-            discovered_services = list_compose_services(compose_path)
+            discovered_services = compose_service_names
             discovered_service_ports = list_compose_service_ports(compose_path)
             discovered_published_ports = list_compose_service_ports(
                 compose_path,
@@ -507,7 +643,7 @@ def run_wizard() -> Config:
                 compose_services = _choose_services(discovered_services)
             _collect_missing_compose_env(compose_path)
 
-    if source_kind == SourceKind.DOCKERFILE:
+    if is_dockerfile:
         if _confirm("Expose a host port for this service?", default=False):
             container_port = _prompt_int("Container port", 8080)
             host_port = _prompt_int("Host port", container_port)
@@ -526,24 +662,20 @@ def run_wizard() -> Config:
     if _confirm("Require bearer token authentication at proxy?", default=False):
         auth_token = _prompt("Bearer token", "") or None
 
-    if (
-        source_kind == SourceKind.COMPOSE
-        and access_mode != AccessMode.LOCALHOST
-        and domain is None
-        and auth_token is None
-    ):
+    proxy_enabled = domain is not None or auth_token is not None
+    if not proxy_enabled and is_compose and access_mode is not AccessMode.LOCALHOST:
         print("Compose source with non-local access requires managed proxy mode.")
         if _confirm("Enable bearer token authentication now?", default=True):
             auth_token = _prompt("Bearer token", "") or None
+            proxy_enabled = auth_token is not None
         else:
             access_mode = AccessMode.LOCALHOST
 
-    proxy_enabled = domain is not None or auth_token is not None
     if proxy_enabled:
         ingress_mode = _choose_ingress_mode()
         proxy_bind_host = "0.0.0.0" if access_mode == AccessMode.PUBLIC else "127.0.0.1"
         if (
-            source_kind == SourceKind.DOCKERFILE
+            is_dockerfile
             and ingress_mode != IngressMode.MANAGED
             and host_port is None
         ):
@@ -608,7 +740,7 @@ def run_wizard() -> Config:
             print("Host nginx ingress mode selected; using standard host ports 80/443.")
         default_upstream = _default_service_key(service_name)
         default_upstream_port = container_port or 8080
-        if source_kind == SourceKind.COMPOSE:
+        if is_compose:
             selected_default_service = None
             if compose_services:
                 selected_default_service = compose_services[0]
@@ -628,19 +760,15 @@ def run_wizard() -> Config:
                     default_upstream_port = 8080
         default_host = domain or "_"
         default_path_prefix = "/"
-        if source_kind == SourceKind.COMPOSE:
+        if is_compose:
             selected_services = list(compose_services or discovered_services)
-            if ingress_mode == IngressMode.MANAGED:
-                route_candidates = [
-                    svc for svc in selected_services if svc in discovered_service_ports
-                ]
-            else:
-                route_candidates = [
-                    svc for svc in selected_services if svc in discovered_host_ports
-                ]
-            skipped = [svc for svc in selected_services if svc not in discovered_service_ports]
-            if ingress_mode != IngressMode.MANAGED:
-                skipped = [svc for svc in selected_services if svc not in discovered_host_ports]
+            ports_for_mode = (
+                discovered_service_ports
+                if ingress_mode == IngressMode.MANAGED
+                else discovered_host_ports
+            )
+            route_candidates = [svc for svc in selected_services if svc in ports_for_mode]
+            skipped = [svc for svc in selected_services if svc not in ports_for_mode]
             if skipped:
                 print(
                     "Skipping route suggestions for services without host-reachable ports: "
@@ -660,7 +788,7 @@ def run_wizard() -> Config:
                         "Routing suggestions limited to services with published host ports."
                     )
             if len(selected_services) > 1:
-                suggested_routes: Tuple[str, ...] = tuple()
+                suggested_routes: Tuple[ProxyRoute, ...] = tuple()
                 prompt = "Use these suggested /service routes?"
                 heading = "Suggested default URLs (one path per selected service):"
                 if domain is not None:
@@ -687,19 +815,20 @@ def run_wizard() -> Config:
                         )
                 if suggested_routes:
                     print(heading)
-                    for raw_route in suggested_routes:
-                        parsed_route = parse_proxy_route(raw_route)
+                    for suggested in suggested_routes:
                         url_hint = _route_url_hint(
-                            parsed_route,
+                            suggested,
                             tls_enabled=domain is not None,
                             default_domain=domain,
                         )
                         print(
                             f"  - {url_hint} -> "
-                            f"{parsed_route.upstream_host}:{parsed_route.upstream_port}"
+                            f"{suggested.upstream_host}:{suggested.upstream_port}"
                         )
                     if _confirm(prompt, default=True):
-                        proxy_routes = suggested_routes
+                        proxy_routes = tuple(
+                            _format_route_spec(route) for route in suggested_routes
+                        )
                 if ingress_mode == IngressMode.MANAGED:
                     default_path_prefix = f"/{_default_route_path_segment(default_upstream)}"
         if proxy_routes is None:
@@ -709,26 +838,16 @@ def run_wizard() -> Config:
                 default_port=default_upstream_port,
                 default_path_prefix=default_path_prefix,
             )
-        if source_kind == SourceKind.COMPOSE and ingress_mode != IngressMode.MANAGED and proxy_routes is None:
+        if is_compose and ingress_mode != IngressMode.MANAGED and proxy_routes is None:
             print("external-nginx/takeover with compose requires at least one hostname route.")
-            routes: List[str] = []
-            default_route = (
-                f"{default_host}={default_upstream}:{default_upstream_port}"
-                if default_path_prefix == "/"
-                else f"{default_host}{default_path_prefix}={default_upstream}:{default_upstream_port}"
+            proxy_routes = _pick_proxy_routes(
+                default_host=default_host,
+                default_upstream=default_upstream,
+                default_port=default_upstream_port,
+                default_path_prefix=default_path_prefix,
+                require_one=True,
             )
-            while True:
-                raw = _prompt("Proxy route", default_route if not routes else "")
-                try:
-                    route = parse_proxy_route(raw)
-                except ValueError as exc:
-                    print(f"Invalid route: {exc}")
-                    continue
-                routes.append(_format_route_spec(route))
-                if not _confirm("Add another route?", default=False):
-                    break
-            proxy_routes = tuple(routes)
-        if source_kind == SourceKind.COMPOSE:
+        if is_compose:
             if proxy_routes is None:
                 proxy_upstream_service = default_upstream
                 proxy_upstream_port = default_upstream_port
@@ -764,53 +883,7 @@ def run_wizard() -> Config:
         proxy_upstream_port=proxy_upstream_port,
     )
 
-    print()
-    print("Review")
-    print(f"  Service name : {cfg.service_name}")
-    print(f"  Source dir   : {cfg.source_dir}")
-    print(f"  Source kind  : {cfg.source_kind.value}")
-    print(f"  Base dir     : {cfg.base_dir}")
-    print(f"  Access mode  : {cfg.access_mode.value}")
-    print(f"  Ingress mode : {cfg.ingress_mode.value}")
-    if cfg.host_port is not None:
-        print(
-            f"  Port mapping : "
-            f"{cfg.effective_bind_host}:{cfg.host_port}->{cfg.container_port}"
-        )
-    else:
-        print("  Port mapping : none")
-    if cfg.source_kind == SourceKind.COMPOSE and cfg.compose_services:
-        print(f"  Compose svcs : {', '.join(cfg.compose_services)}")
-    elif cfg.source_kind == SourceKind.COMPOSE:
-        print("  Compose svcs : all")
-    if cfg.tls_enabled:
-        print(f"  Domain       : {cfg.domain}")
-        print(f"  TLS email    : {cfg.certbot_email}")
-        print(
-            f"  Proxy ports  : "
-            f"{cfg.effective_proxy_http_port}->{cfg.effective_proxy_https_port}"
-        )
-        print(
-            f"  Proxy target : "
-            f"{cfg.effective_proxy_upstream_service}:{cfg.effective_proxy_upstream_port}"
-        )
-    elif cfg.reverse_proxy_enabled:
-        print(f"  Proxy port   : {cfg.effective_proxy_http_port}")
-        print(
-            f"  Proxy target : "
-            f"{cfg.effective_proxy_upstream_service}:{cfg.effective_proxy_upstream_port}"
-        )
-    if cfg.proxy_routes:
-        rendered = ", ".join(
-            _format_route_summary(r)
-            for r in cfg.proxy_routes
-        )
-        print(f"  Proxy routes : {rendered}")
-    if cfg.auth_token is not None:
-        print("  Auth token   : enabled")
-    else:
-        print("  Auth token   : disabled")
-    print()
+    print("\n".join(_review_lines(cfg)))
 
     if not _confirm("Proceed with deployment?", default=True):
         print("Aborted.")
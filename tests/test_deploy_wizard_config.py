@@ -1,3 +1,5 @@
+import hashlib
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
@@ -7,6 +9,7 @@ from deploy_wizard.config import (
     Config,
     IngressMode,
     SourceKind,
+    has_dockerfile,
     list_compose_required_env_vars,
     list_missing_compose_env_vars,
     read_dotenv_values,
@@ -15,31 +18,57 @@ from deploy_wizard.config import (
     list_compose_services,
 )
 
+_DOCKERFILE = "FROM alpine:3.20\n"
+_EMPTY_COMPOSE = "services: {}\n"
+
 
 class DeployWizardConfigTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._fixture_root = Path(tempfile.mkdtemp())
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls._fixture_root, ignore_errors=True)
+
+    def _source(self, name: str, content: str) -> Path:
+        """
+        Return a read-only source dir holding one file, shared by content.
+        """
+        digest = hashlib.blake2b(f"{name}\0{content}".encode("utf-8"), digest_size=8)
+        src = self._fixture_root / digest.hexdigest()
+        if not src.is_dir():
+            src.mkdir()
+            (src / name).write_text(content, encoding="utf-8")
+        return src
+
+    def test_has_dockerfile_requires_a_regular_file(self) -> None:
+        self.assertTrue(has_dockerfile(self._source("Dockerfile", _DOCKERFILE)))
+        src = self._fixture_root / "dockerfile-dir"
+        (src / "Dockerfile").mkdir(parents=True)
+        self.assertFalse(has_dockerfile(src))
+
     def test_list_compose_required_env_vars_detects_required_only(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            compose = src / "docker-compose.yml"
-            compose.write_text(
-                "services:\n"
-                "  api:\n"
-                "    image: ${IMAGE_NAME}\n"
-                "    environment:\n"
-                "      - MAYBE=$MAYBE\n"
-                "      - OPTIONAL_A=${HF_TOKEN:-}\n"
-                "      - OPTIONAL_B=${WITH_DEFAULT-default}\n"
-                "      - STRICT=${AUTH_TOKEN:?auth required}\n",
-                encoding="utf-8",
-            )
-            self.assertEqual(
-                list_compose_required_env_vars(compose),
-                (
-                    ("IMAGE_NAME", False),
-                    ("MAYBE", False),
-                    ("AUTH_TOKEN", True),
-                ),
-            )
+        src = self._source(
+            "docker-compose.yml",
+            "services:\n"
+            "  api:\n"
+            "    image: ${IMAGE_NAME}\n"
+            "    environment:\n"
+            "      - MAYBE=$MAYBE\n"
+            "      - OPTIONAL_A=${HF_TOKEN:-}\n"
+            "      - OPTIONAL_B=${WITH_DEFAULT-default}\n"
+            "      - STRICT=${AUTH_TOKEN:?auth required}\n",
+        )
+        compose = src / "docker-compose.yml"
+        self.assertTupleEqual(
+            list_compose_required_env_vars(compose),
+            (
+                ("IMAGE_NAME", False),
+                ("MAYBE", False),
+                ("AUTH_TOKEN", True),
+            ),
+        )
 
     def test_list_missing_compose_env_vars_respects_dotenv_and_env(self) -> None:
         with tempfile.TemporaryDirectory() as td:
@@ -64,47 +93,52 @@ class DeployWizardConfigTests(unittest.TestCase):
                 dotenv_path=src / ".env",
                 env={},
             )
-            self.assertEqual(missing, (("AUTH_TOKEN", True),))
+            self.assertTupleEqual(missing, (("AUTH_TOKEN", True),))
             missing_with_env = list_missing_compose_env_vars(
                 compose,
                 dotenv_path=src / ".env",
                 env={"AUTH_TOKEN": "TokenABC123"},
             )
-            self.assertEqual(missing_with_env, tuple())
+            self.assertTupleEqual(missing_with_env, tuple())
 
     def test_read_dotenv_values_supports_export_and_quotes(self) -> None:
+        src = self._source(
+            ".env",
+            "PLAIN=value\n"
+            "export QUOTED=\"space value\"\n"
+            "SINGLE='abc'\n"
+            "# comment\n",
+        )
+        env_path = src / ".env"
+        self.assertEqual(
+            read_dotenv_values(env_path),
+            {
+                "PLAIN": "value",
+                "QUOTED": "space value",
+                "SINGLE": "abc",
+            },
+        )
+
+    def test_read_dotenv_values_returns_independent_copies(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             env_path = Path(td) / ".env"
-            env_path.write_text(
-                "PLAIN=value\n"
-                "export QUOTED=\"space value\"\n"
-                "SINGLE='abc'\n"
-                "# comment\n",
-                encoding="utf-8",
-            )
-            self.assertEqual(
-                read_dotenv_values(env_path),
-                {
-                    "PLAIN": "value",
-                    "QUOTED": "space value",
-                    "SINGLE": "abc",
-                },
-            )
+            env_path.write_text("PLAIN=value\n", encoding="utf-8")
+            first = read_dotenv_values(env_path)
+            first["PLAIN"] = "changed"
+            self.assertEqual(read_dotenv_values(env_path), {"PLAIN": "value"})
+            env_path.write_text("PLAIN=value\nEXTRA=1\n", encoding="utf-8")
+            self.assertEqual(read_dotenv_values(env_path), {"PLAIN": "value", "EXTRA": "1"})
 
     def test_auto_detects_compose(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text("services: {}\n", encoding="utf-8")
-            cfg = Config(service_name="svc", source_dir=src)
-            self.assertEqual(cfg.source_kind, SourceKind.COMPOSE)
-            self.assertEqual(cfg.source_compose_path, src / "docker-compose.yml")
+        src = self._source("docker-compose.yml", _EMPTY_COMPOSE)
+        cfg = Config(service_name="svc", source_dir=src)
+        self.assertEqual(cfg.source_kind, SourceKind.COMPOSE)
+        self.assertEqual(cfg.source_compose_path, src / "docker-compose.yml")
 
     def test_auto_detects_dockerfile(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "Dockerfile").write_text("FROM alpine:3.20\n", encoding="utf-8")
-            cfg = Config(service_name="svc", source_dir=src)
-            self.assertEqual(cfg.source_kind, SourceKind.DOCKERFILE)
+        src = self._source("Dockerfile", _DOCKERFILE)
+        cfg = Config(service_name="svc", source_dir=src)
+        self.assertEqual(cfg.source_kind, SourceKind.DOCKERFILE)
 
     def test_no_supported_source_files_raises(self) -> None:
         with tempfile.TemporaryDirectory() as td:
@@ -112,523 +146,386 @@ class DeployWizardConfigTests(unittest.TestCase):
             with self.assertRaises(ValueError):
                 Config(service_name="svc", source_dir=src)
 
-    def test_port_mapping_must_be_complete_pair(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "Dockerfile").write_text("FROM alpine:3.20\n", encoding="utf-8")
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    source_kind=SourceKind.DOCKERFILE,
-                    host_port=8080,
-                )
-
     def test_compose_project_name_is_normalized(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text("services: {}\n", encoding="utf-8")
-            cfg = Config(service_name="My.Service", source_dir=src)
-            self.assertEqual(cfg.compose_project_name, "my-service")
-
-    def test_registry_retries_must_be_positive(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text("services: {}\n", encoding="utf-8")
-            with self.assertRaises(ValueError):
-                Config(service_name="svc", source_dir=src, registry_retries=0)
+        src = self._source("docker-compose.yml", _EMPTY_COMPOSE)
+        cfg = Config(service_name="My.Service", source_dir=src)
+        self.assertEqual(cfg.compose_project_name, "my-service")
+
+    def test_config_validation_errors(self) -> None:
+        compose = dict(source_dir=self._source("docker-compose.yml", _EMPTY_COMPOSE))
+        dockerfile = dict(
+            source_dir=self._source("Dockerfile", _DOCKERFILE),
+            source_kind=SourceKind.DOCKERFILE,
+        )
+        published = dict(dockerfile, container_port=8080, host_port=18080)
+        cases = (
+            ("incomplete port pair", dict(dockerfile, host_port=8080)),
+            ("registry retries", dict(compose, registry_retries=0)),
+            ("retry backoff", dict(compose, retry_backoff_seconds=0)),
+            (
+                "retry backoff cap",
+                dict(compose, retry_backoff_seconds=10, retry_backoff_max_seconds=5),
+            ),
+            (
+                "https port without domain",
+                dict(published, auth_token="TokenABC123", proxy_https_port=8443),
+            ),
+            (
+                "equal http and https ports",
+                dict(
+                    published,
+                    access_mode=AccessMode.PUBLIC,
+                    domain="api.example.com",
+                    certbot_email="ops@example.com",
+                    proxy_http_port=8081,
+                    proxy_https_port=8081,
+                ),
+            ),
+        )
+        for label, kwargs in cases:
+            with self.subTest(label):
+                with self.assertRaises(ValueError):
+                    Config(service_name="svc", **kwargs)
+
+    def test_argument_errors_are_reported_before_source_dir_checks(self) -> None:
+        missing = self._fixture_root / "missing"
+        with self.assertRaisesRegex(ValueError, "set together"):
+            Config(service_name="svc", source_dir=missing, host_port=8080)
+        with self.assertRaisesRegex(ValueError, "registry_retries"):
+            Config(service_name="svc", source_dir=missing, registry_retries=0)
+
+    def test_compose_config_validation_errors(self) -> None:
+        def compose(*services: str) -> dict:
+            return dict(
+                source_dir=self._source(
+                    "docker-compose.yml",
+                    "services:\n"
+                    + "".join(
+                        f"  {name}:\n    image: example/{name}:latest\n" for name in services
+                    ),
+                ),
+                source_kind=SourceKind.COMPOSE,
+            )
 
-    def test_retry_backoff_seconds_must_be_positive(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text("services: {}\n", encoding="utf-8")
-            with self.assertRaises(ValueError):
-                Config(service_name="svc", source_dir=src, retry_backoff_seconds=0)
+        public = dict(access_mode=AccessMode.PUBLIC)
+        tls = dict(public, domain="api.example.com", certbot_email="ops@example.com")
+        auth = dict(public, auth_token="TokenABC123")
+        external = dict(auth, ingress_mode=IngressMode.EXTERNAL_NGINX)
+        cases = (
+            (
+                "unknown compose service",
+                dict(compose("api"), compose_services=("api", "unknown")),
+            ),
+            (
+                "compose services for dockerfile",
+                dict(
+                    source_dir=self._source("Dockerfile", _DOCKERFILE),
+                    source_kind=SourceKind.DOCKERFILE,
+                    compose_services=("api",),
+                ),
+            ),
+            ("tls without upstream port", dict(compose("api"), **tls)),
+            (
+                "proxy settings without domain",
+                dict(
+                    source_dir=self._source("docker-compose.yml", _EMPTY_COMPOSE),
+                    certbot_email="ops@example.com",
+                ),
+            ),
+            (
+                "upstream outside deployed subset",
+                dict(
+                    compose("api", "worker"),
+                    **tls,
+                    proxy_upstream_service="worker",
+                    proxy_upstream_port=8080,
+                    compose_services=("api",),
+                ),
+            ),
+            ("public compose without proxy", dict(compose("api"), **public)),
+            (
+                "duplicate route host and path",
+                dict(
+                    compose("orchestrator", "logbook"),
+                    **auth,
+                    proxy_routes=(
+                        "apps.example.com/orchestrator=orchestrator:8080",
+                        "apps.example.com/orchestrator=logbook:8010",
+                    ),
+                ),
+            ),
+            (
+                "routes with single upstream flags",
+                dict(
+                    compose("orchestrator"),
+                    **auth,
+                    proxy_routes=("wiki.example.com=orchestrator:8090",),
+                    proxy_upstream_service="orchestrator",
+                ),
+            ),
+            (
+                "tls wildcard route host",
+                dict(
+                    compose("orchestrator"),
+                    **tls,
+                    proxy_routes=("*.example.com=orchestrator:8090",),
+                ),
+            ),
+            (
+                "route upstream outside deployed subset",
+                dict(
+                    compose("orchestrator", "mail"),
+                    **auth,
+                    compose_services=("orchestrator",),
+                    proxy_routes=("mail.example.com=mail:4000",),
+                ),
+            ),
+            ("external nginx without routes", dict(compose("orchestrator"), **external)),
+            (
+                "external nginx service-name upstream",
+                dict(
+                    compose("orchestrator"),
+                    **external,
+                    proxy_routes=("api.example.com=orchestrator:8080",),
+                ),
+            ),
+        )
+        for label, kwargs in cases:
+            with self.subTest(label):
+                with self.assertRaises(ValueError):
+                    Config(service_name="svc", **kwargs)
 
     def test_list_compose_services_discovers_services(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            compose = src / "docker-compose.yml"
-            compose.write_text(
-                "services:\n"
-                "  api:\n"
-                "    image: example/api:latest\n"
-                "  worker:\n"
-                "    image: example/worker:latest\n",
-                encoding="utf-8",
-            )
-            self.assertEqual(list_compose_services(compose), ["api", "worker"])
+        src = self._source(
+            "docker-compose.yml",
+            "services:\n"
+            "  api:\n"
+            "    image: example/api:latest\n"
+            "  worker:\n"
+            "    image: example/worker:latest\n",
+        )
+        compose = src / "docker-compose.yml"
+        self.assertEqual(list_compose_services(compose), ["api", "worker"])
 
     def test_list_compose_service_ports_discovers_ports(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            compose = src / "docker-compose.yml"
-            compose.write_text(
-                "services:\n"
-                "  workflow-studio:\n"
-                "    image: example/workflow-studio:latest\n"
-                "    ports:\n"
-                '      - "8000:8000"\n'
-                "  orchestrator:\n"
-                "    image: example/orchestrator:latest\n"
-                "    ports:\n"
-                '      - "127.0.0.1:8080:8080"\n'
-                "  logbook:\n"
-                "    image: example/logbook:latest\n"
-                "    expose:\n"
-                '      - "8010"\n',
-                encoding="utf-8",
-            )
-            self.assertEqual(
-                list_compose_service_ports(compose),
-                {
-                    "workflow-studio": 8000,
-                    "orchestrator": 8080,
-                    "logbook": 8010,
-                },
-            )
-            self.assertEqual(
-                list_compose_service_ports(compose, include_expose=False),
-                {
-                    "workflow-studio": 8000,
-                    "orchestrator": 8080,
-                },
-            )
-            self.assertEqual(
-                list_compose_service_host_ports(compose),
-                {
-                    "workflow-studio": 8000,
-                    "orchestrator": 8080,
-                },
-            )
+        src = self._source(
+            "docker-compose.yml",
+            "services:\n"
+            "  workflow-studio:\n"
+            "    image: example/workflow-studio:latest\n"
+            "    ports:\n"
+            '      - "8000:8000"\n'
+            "  orchestrator:\n"
+            "    image: example/orchestrator:latest\n"
+            "    ports:\n"
+            '      - "127.0.0.1:8080:8080"\n'
+            "  logbook:\n"
+            "    image: example/logbook:latest\n"
+            "    expose:\n"
+            '      - "8010"\n',
+        )
+        compose = src / "docker-compose.yml"
+        self.assertEqual(
+            list_compose_service_ports(compose),
+            {
+                "workflow-studio": 8000,
+                "orchestrator": 8080,
+                "logbook": 8010,
+            },
+        )
+        self.assertEqual(
+            list_compose_service_ports(compose, include_expose=False),
+            {
+                "workflow-studio": 8000,
+                "orchestrator": 8080,
+            },
+        )
+        self.assertEqual(
+            list_compose_service_host_ports(compose),
+            {
+                "workflow-studio": 8000,
+                "orchestrator": 8080,
+            },
+        )
 
     def test_list_compose_service_ports_handles_extensions_and_anchors(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            compose = src / "docker-compose.yml"
+        src = self._source(
+            "docker-compose.yml",
+            "x-logging: &default-logging\n"
+            "  driver: json-file\n"
+            "  options:\n"
+            '    max-size: "10m"\n'
+            '    max-file: "3"\n'
+            "\n"
+            "services:\n"
+            "  orchestrator:\n"
+            "    build: ./orchestrator\n"
+            "    ports:\n"
+            '      - "127.0.0.1:8080:8080"\n'
+            "    logging: *default-logging\n"
+            "  workflow-studio:\n"
+            "    build:\n"
+            "      context: ./apps\n"
+            "      dockerfile: workflow-studio/Dockerfile\n"
+            "    ports:\n"
+            '      - "127.0.0.1:8000:8000"\n'
+            "    logging: *default-logging\n"
+            "  stt:\n"
+            "    build: ./services/stt\n"
+            "    expose:\n"
+            '      - "10300"\n'
+            "    logging: *default-logging\n",
+        )
+        compose = src / "docker-compose.yml"
+        self.assertEqual(
+            list_compose_services(compose),
+            ["orchestrator", "workflow-studio", "stt"],
+        )
+        self.assertEqual(
+            list_compose_service_ports(compose),
+            {
+                "orchestrator": 8080,
+                "workflow-studio": 8000,
+                "stt": 10300,
+            },
+        )
+        self.assertEqual(
+            list_compose_service_ports(compose, include_expose=False),
+            {
+                "orchestrator": 8080,
+                "workflow-studio": 8000,
+            },
+        )
+
+    def test_list_compose_service_ports_rereads_edited_file(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            compose = Path(td) / "docker-compose.yml"
             compose.write_text(
-                "x-logging: &default-logging\n"
-                "  driver: json-file\n"
-                "  options:\n"
-                '    max-size: "10m"\n'
-                '    max-file: "3"\n'
-                "\n"
                 "services:\n"
-                "  orchestrator:\n"
-                "    build: ./orchestrator\n"
-                "    ports:\n"
-                '      - "127.0.0.1:8080:8080"\n'
-                "    logging: *default-logging\n"
-                "  workflow-studio:\n"
-                "    build:\n"
-                "      context: ./apps\n"
-                "      dockerfile: workflow-studio/Dockerfile\n"
+                "  api:\n"
                 "    ports:\n"
-                '      - "127.0.0.1:8000:8000"\n'
-                "    logging: *default-logging\n"
-                "  stt:\n"
-                "    build: ./services/stt\n"
-                "    expose:\n"
-                '      - "10300"\n'
-                "    logging: *default-logging\n",
+                '      - "8000:8000"\n',
                 encoding="utf-8",
             )
-            self.assertEqual(
-                list_compose_services(compose),
-                ["orchestrator", "workflow-studio", "stt"],
-            )
-            self.assertEqual(
-                list_compose_service_ports(compose),
-                {
-                    "orchestrator": 8080,
-                    "workflow-studio": 8000,
-                    "stt": 10300,
-                },
-            )
-            self.assertEqual(
-                list_compose_service_ports(compose, include_expose=False),
-                {
-                    "orchestrator": 8080,
-                    "workflow-studio": 8000,
-                },
-            )
-
-    def test_compose_services_must_exist_when_discoverable(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text(
+            self.assertEqual(list_compose_service_host_ports(compose), {"api": 8000})
+            compose.write_text(
                 "services:\n"
                 "  api:\n"
-                "    image: example/api:latest\n",
+                "    ports:\n"
+                '      - "18000:8000"\n',
                 encoding="utf-8",
             )
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    compose_services=("api", "unknown"),
-                )
-
-    def test_compose_services_for_dockerfile_raises(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "Dockerfile").write_text("FROM alpine:3.20\n", encoding="utf-8")
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    source_kind=SourceKind.DOCKERFILE,
-                    compose_services=("api",),
-                )
+            self.assertEqual(list_compose_service_host_ports(compose), {"api": 18000})
+            self.assertEqual(list_compose_service_ports(compose), {"api": 8000})
 
     def test_tls_dockerfile_uses_container_port_as_upstream(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "Dockerfile").write_text("FROM alpine:3.20\n", encoding="utf-8")
-            cfg = Config(
-                service_name="svc",
-                source_dir=src,
-                source_kind=SourceKind.DOCKERFILE,
-                container_port=8080,
-                host_port=18080,
-                access_mode=AccessMode.PUBLIC,
-                domain="api.example.com",
-                certbot_email="ops@example.com",
-            )
-            self.assertTrue(cfg.tls_enabled)
-            self.assertEqual(cfg.effective_proxy_upstream_service, "svc")
-            self.assertEqual(cfg.effective_proxy_upstream_port, 8080)
-
-    def test_tls_compose_requires_upstream_port(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text(
-                "services:\n"
-                "  api:\n"
-                "    image: example/api:latest\n",
-                encoding="utf-8",
-            )
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    source_kind=SourceKind.COMPOSE,
-                    access_mode=AccessMode.PUBLIC,
-                    domain="api.example.com",
-                    certbot_email="ops@example.com",
-                )
-
-    def test_proxy_settings_require_domain(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text("services: {}\n", encoding="utf-8")
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    certbot_email="ops@example.com",
-                )
-
-    def test_proxy_upstream_service_must_be_selected_if_subset_deployed(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text(
-                "services:\n"
-                "  api:\n"
-                "    image: example/api:latest\n"
-                "  worker:\n"
-                "    image: example/worker:latest\n",
-                encoding="utf-8",
-            )
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    access_mode=AccessMode.PUBLIC,
-                    domain="api.example.com",
-                    certbot_email="ops@example.com",
-                    proxy_upstream_service="worker",
-                    proxy_upstream_port=8080,
-                    compose_services=("api",),
-                )
+        src = self._source("Dockerfile", _DOCKERFILE)
+        cfg = Config(
+            service_name="svc",
+            source_dir=src,
+            source_kind=SourceKind.DOCKERFILE,
+            container_port=8080,
+            host_port=18080,
+            access_mode=AccessMode.PUBLIC,
+            domain="api.example.com",
+            certbot_email="ops@example.com",
+        )
+        self.assertTrue(cfg.tls_enabled)
+        self.assertEqual(cfg.effective_proxy_upstream_service, "svc")
+        self.assertEqual(cfg.effective_proxy_upstream_port, 8080)
 
     def test_auth_token_enables_proxy_mode(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "Dockerfile").write_text("FROM alpine:3.20\n", encoding="utf-8")
-            cfg = Config(
-                service_name="svc",
-                source_dir=src,
-                source_kind=SourceKind.DOCKERFILE,
-                container_port=8080,
-                host_port=18080,
-                auth_token="TokenABC123",
-            )
-            self.assertTrue(cfg.reverse_proxy_enabled)
-            self.assertEqual(cfg.effective_proxy_upstream_port, 8080)
-            self.assertEqual(cfg.effective_proxy_http_port, 80)
-
-    def test_proxy_https_port_requires_domain(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "Dockerfile").write_text("FROM alpine:3.20\n", encoding="utf-8")
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    source_kind=SourceKind.DOCKERFILE,
-                    container_port=8080,
-                    host_port=18080,
-                    auth_token="TokenABC123",
-                    proxy_https_port=8443,
-                )
-
-    def test_proxy_http_and_https_ports_must_differ(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "Dockerfile").write_text("FROM alpine:3.20\n", encoding="utf-8")
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    source_kind=SourceKind.DOCKERFILE,
-                    container_port=8080,
-                    host_port=18080,
-                    access_mode=AccessMode.PUBLIC,
-                    domain="api.example.com",
-                    certbot_email="ops@example.com",
-                    proxy_http_port=8081,
-                    proxy_https_port=8081,
-                )
-
-    def test_compose_public_mode_requires_proxy(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text(
-                "services:\n"
-                "  api:\n"
-                "    image: example/api:latest\n",
-                encoding="utf-8",
-            )
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    source_kind=SourceKind.COMPOSE,
-                    access_mode=AccessMode.PUBLIC,
-                )
+        src = self._source("Dockerfile", _DOCKERFILE)
+        cfg = Config(
+            service_name="svc",
+            source_dir=src,
+            source_kind=SourceKind.DOCKERFILE,
+            container_port=8080,
+            host_port=18080,
+            auth_token="TokenABC123",
+        )
+        self.assertTrue(cfg.reverse_proxy_enabled)
+        self.assertEqual(cfg.effective_proxy_upstream_port, 8080)
+        self.assertEqual(cfg.effective_proxy_http_port, 80)
 
     def test_public_access_mode_sets_bind_host(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "Dockerfile").write_text("FROM alpine:3.20\n", encoding="utf-8")
-            cfg = Config(
-                service_name="svc",
-                source_dir=src,
-                source_kind=SourceKind.DOCKERFILE,
-                access_mode=AccessMode.PUBLIC,
-            )
-            self.assertEqual(cfg.effective_bind_host, "0.0.0.0")
+        src = self._source("Dockerfile", _DOCKERFILE)
+        cfg = Config(
+            service_name="svc",
+            source_dir=src,
+            source_kind=SourceKind.DOCKERFILE,
+            access_mode=AccessMode.PUBLIC,
+        )
+        self.assertEqual(cfg.effective_bind_host, "0.0.0.0")
 
     def test_proxy_routes_are_parsed_and_cert_domains_include_route_hosts(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text(
-                "services:\n"
-                "  orchestrator:\n"
-                "    image: example/orchestrator:latest\n"
-                "  mail:\n"
-                "    image: example/mail:latest\n",
-                encoding="utf-8",
-            )
-            cfg = Config(
-                service_name="svc",
-                source_dir=src,
-                source_kind=SourceKind.COMPOSE,
-                access_mode=AccessMode.PUBLIC,
-                domain="api.example.com",
-                certbot_email="ops@example.com",
-                proxy_routes=(
-                    "wiki.example.com=orchestrator:8090",
-                    "mail.example.com=mail:4000",
-                ),
-            )
-            self.assertEqual(len(cfg.effective_proxy_routes), 2)
-            self.assertEqual(
-                cfg.cert_domain_names,
-                ("api.example.com", "wiki.example.com", "mail.example.com"),
-            )
+        src = self._source(
+            "docker-compose.yml",
+            "services:\n"
+            "  orchestrator:\n"
+            "    image: example/orchestrator:latest\n"
+            "  mail:\n"
+            "    image: example/mail:latest\n",
+        )
+        cfg = Config(
+            service_name="svc",
+            source_dir=src,
+            source_kind=SourceKind.COMPOSE,
+            access_mode=AccessMode.PUBLIC,
+            domain="api.example.com",
+            certbot_email="ops@example.com",
+            proxy_routes=(
+                "wiki.example.com=orchestrator:8090",
+                "mail.example.com=mail:4000",
+            ),
+        )
+        self.assertEqual(len(cfg.effective_proxy_routes), 2)
+        self.assertEqual(
+            cfg.cert_domain_names,
+            ("api.example.com", "wiki.example.com", "mail.example.com"),
+        )
 
     def test_proxy_routes_support_host_path_prefixes(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text(
-                "services:\n"
-                "  orchestrator:\n"
-                "    image: example/orchestrator:latest\n"
-                "  logbook:\n"
-                "    image: example/logbook:latest\n",
-                encoding="utf-8",
-            )
-            cfg = Config(
-                service_name="svc",
-                source_dir=src,
-                source_kind=SourceKind.COMPOSE,
-                access_mode=AccessMode.PUBLIC,
-                domain="apps.example.com",
-                certbot_email="ops@example.com",
-                proxy_routes=(
-                    "apps.example.com/orchestrator=orchestrator:8080",
-                    "apps.example.com/logbook=logbook:8010",
-                ),
-            )
-            self.assertEqual(len(cfg.effective_proxy_routes), 2)
-            self.assertEqual(cfg.effective_proxy_routes[0].path_prefix, "/orchestrator")
-            self.assertEqual(cfg.effective_proxy_routes[1].path_prefix, "/logbook")
-            self.assertEqual(cfg.cert_domain_names, ("apps.example.com",))
-
-    def test_proxy_routes_reject_duplicate_host_and_path(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text(
-                "services:\n"
-                "  orchestrator:\n"
-                "    image: example/orchestrator:latest\n"
-                "  logbook:\n"
-                "    image: example/logbook:latest\n",
-                encoding="utf-8",
-            )
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    source_kind=SourceKind.COMPOSE,
-                    access_mode=AccessMode.PUBLIC,
-                    auth_token="TokenABC123",
-                    proxy_routes=(
-                        "apps.example.com/orchestrator=orchestrator:8080",
-                        "apps.example.com/orchestrator=logbook:8010",
-                    ),
-                )
-
-    def test_proxy_routes_conflict_with_single_upstream_flags(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text(
-                "services:\n"
-                "  orchestrator:\n"
-                "    image: example/orchestrator:latest\n",
-                encoding="utf-8",
-            )
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    source_kind=SourceKind.COMPOSE,
-                    access_mode=AccessMode.PUBLIC,
-                    auth_token="TokenABC123",
-                    proxy_routes=("wiki.example.com=orchestrator:8090",),
-                    proxy_upstream_service="orchestrator",
-                )
-
-    def test_tls_proxy_routes_require_dns_hosts(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text(
-                "services:\n"
-                "  orchestrator:\n"
-                "    image: example/orchestrator:latest\n",
-                encoding="utf-8",
-            )
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    source_kind=SourceKind.COMPOSE,
-                    access_mode=AccessMode.PUBLIC,
-                    domain="api.example.com",
-                    certbot_email="ops@example.com",
-                    proxy_routes=("*.example.com=orchestrator:8090",),
-                )
-
-    def test_compose_proxy_route_upstream_must_be_in_selected_subset(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text(
-                "services:\n"
-                "  orchestrator:\n"
-                "    image: example/orchestrator:latest\n"
-                "  mail:\n"
-                "    image: example/mail:latest\n",
-                encoding="utf-8",
-            )
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    source_kind=SourceKind.COMPOSE,
-                    access_mode=AccessMode.PUBLIC,
-                    auth_token="TokenABC123",
-                    compose_services=("orchestrator",),
-                    proxy_routes=("mail.example.com=mail:4000",),
-                )
-
-    def test_external_nginx_compose_requires_routes(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text(
-                "services:\n"
-                "  orchestrator:\n"
-                "    image: example/orchestrator:latest\n",
-                encoding="utf-8",
-            )
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    source_kind=SourceKind.COMPOSE,
-                    access_mode=AccessMode.PUBLIC,
-                    ingress_mode=IngressMode.EXTERNAL_NGINX,
-                    auth_token="TokenABC123",
-                )
+        src = self._source(
+            "docker-compose.yml",
+            "services:\n"
+            "  orchestrator:\n"
+            "    image: example/orchestrator:latest\n"
+            "  logbook:\n"
+            "    image: example/logbook:latest\n",
+        )
+        cfg = Config(
+            service_name="svc",
+            source_dir=src,
+            source_kind=SourceKind.COMPOSE,
+            access_mode=AccessMode.PUBLIC,
+            domain="apps.example.com",
+            certbot_email="ops@example.com",
+            proxy_routes=(
+                "apps.example.com/orchestrator=orchestrator:8080",
+                "apps.example.com/logbook=logbook:8010",
+            ),
+        )
+        self.assertEqual(len(cfg.effective_proxy_routes), 2)
+        self.assertEqual(cfg.effective_proxy_routes[0].path_prefix, "/orchestrator")
+        self.assertEqual(cfg.effective_proxy_routes[1].path_prefix, "/logbook")
+        self.assertEqual(cfg.cert_domain_names, ("apps.example.com",))
 
     def test_external_nginx_dockerfile_uses_localhost_host_port_route(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "Dockerfile").write_text("FROM alpine:3.20\n", encoding="utf-8")
-            cfg = Config(
-                service_name="svc",
-                source_dir=src,
-                source_kind=SourceKind.DOCKERFILE,
-                access_mode=AccessMode.PUBLIC,
-                ingress_mode=IngressMode.EXTERNAL_NGINX,
-                host_port=18080,
-                container_port=8080,
-                auth_token="TokenABC123",
-            )
-            route = cfg.effective_proxy_routes[0]
-            self.assertEqual(route.upstream_host, "127.0.0.1")
-            self.assertEqual(route.upstream_port, 18080)
-
-    def test_external_nginx_compose_rejects_service_name_upstream_routes(self) -> None:
-        with tempfile.TemporaryDirectory() as td:
-            src = Path(td)
-            (src / "docker-compose.yml").write_text(
-                "services:\n"
-                "  orchestrator:\n"
-                "    image: example/orchestrator:latest\n",
-                encoding="utf-8",
-            )
-            with self.assertRaises(ValueError):
-                Config(
-                    service_name="svc",
-                    source_dir=src,
-                    source_kind=SourceKind.COMPOSE,
-                    access_mode=AccessMode.PUBLIC,
-                    ingress_mode=IngressMode.EXTERNAL_NGINX,
-                    auth_token="TokenABC123",
-                    proxy_routes=("api.example.com=orchestrator:8080",),
-                )
+        src = self._source("Dockerfile", _DOCKERFILE)
+        cfg = Config(
+            service_name="svc",
+            source_dir=src,
+            source_kind=SourceKind.DOCKERFILE,
+            access_mode=AccessMode.PUBLIC,
+            ingress_mode=IngressMode.EXTERNAL_NGINX,
+            host_port=18080,
+            container_port=8080,
+            auth_token="TokenABC123",
+        )
+        route = cfg.effective_proxy_routes[0]
+        self.assertEqual(route.upstream_host, "127.0.0.1")
+        self.assertEqual(route.upstream_port, 18080)
 
 
 if __name__ == "__main__":
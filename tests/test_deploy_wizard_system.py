@@ -1,6 +1,16 @@
+import json
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
-from deploy_wizard.system import _merged_dns
+from deploy_wizard.system import (
+    _docker_compose_ok,
+    _merged_dns,
+    _which,
+    ensure_docker,
+    ensure_docker_daemon_tuning,
+)
 
 
 class DeployWizardSystemTests(unittest.TestCase):
@@ -22,6 +32,37 @@ class DeployWizardSystemTests(unittest.TestCase):
             ["8.8.8.8", "1.1.1.1"],
         )
 
+    def test_ensure_docker_probes_compose_once_per_run(self) -> None:
+        _which.cache_clear()
+        _docker_compose_ok.cache_clear()
+        self.addCleanup(_which.cache_clear)
+        self.addCleanup(_docker_compose_ok.cache_clear)
+        with mock.patch("deploy_wizard.system.shutil.which", return_value="/usr/bin/docker") as which_mock, \
+             mock.patch("deploy_wizard.system.subprocess.run") as run_mock, \
+             mock.patch("deploy_wizard.system.sh") as sh_mock:
+            run_mock.return_value.returncode = 0
+            ensure_docker()
+            ensure_docker()
+        which_mock.assert_called_once_with("docker")
+        run_mock.assert_called_once()
+        sh_mock.assert_not_called()
+
+    def test_docker_daemon_tuning_is_idempotent(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            daemon_path = Path(td) / "daemon.json"
+            daemon_path.write_text(json.dumps({"dns": ["127.0.0.53"]}), encoding="utf-8")
+            with mock.patch("deploy_wizard.system._DAEMON_JSON_PATH", daemon_path), \
+                 mock.patch("deploy_wizard.system.os.name", "posix"), \
+                 mock.patch("deploy_wizard.system.log_line"), \
+                 mock.patch("deploy_wizard.system.sh") as sh_mock:
+                ensure_docker_daemon_tuning()
+                ensure_docker_daemon_tuning()
+            written = json.loads(daemon_path.read_text(encoding="utf-8"))
+            backup = daemon_path.with_suffix(".json.bak").read_text(encoding="utf-8")
+        self.assertEqual(written["dns"], ["1.1.1.1", "8.8.8.8"])
+        self.assertEqual(json.loads(backup), {"dns": ["127.0.0.53"]})
+        sh_mock.assert_called_once_with("systemctl restart docker")
+
 
 if __name__ == "__main__":
     unittest.main()
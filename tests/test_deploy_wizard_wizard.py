@@ -1,14 +1,21 @@
+import os
+import stat
 import tempfile
 import unittest
 from pathlib import Path
 from unittest import mock
 
-from deploy_wizard.config import parse_proxy_route
+from deploy_wizard.config import ProxyRoute
 from deploy_wizard.wizard import (
     _build_compose_path_routes,
     _build_compose_subdomain_routes,
     _build_compose_subdomain_host_routes,
+    _choose_services,
     _collect_missing_compose_env,
+    _default_subdomain_label,
+    _auto_pick_port,
+    _PORT_PROBE_CACHE,
+    _port_available,
     _upsert_dotenv_values,
 )
 
@@ -31,6 +38,68 @@ class DeployWizardWizardTests(unittest.TestCase):
             self.assertIn("UNCHANGED=keep", content)
             self.assertIn('NEW_KEY="new value"', content)
 
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_upsert_dotenv_values_preserves_file_mode(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            env_path = Path(td) / ".env"
+            env_path.write_text("A=1\n", encoding="utf-8")
+            env_path.chmod(0o600)
+            _upsert_dotenv_values(env_path, [("A", "2")])
+            self.assertEqual(stat.S_IMODE(env_path.stat().st_mode), 0o600)
+            self.assertEqual(env_path.read_text(encoding="utf-8"), "A=2\n")
+            self.assertEqual(sorted(p.name for p in Path(td).iterdir()), [".env"])
+
+    @unittest.skipIf(os.name == "nt", "POSIX symlinks and permission bits")
+    def test_upsert_dotenv_values_updates_symlink_target(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            real_path = Path(td) / "real.env"
+            real_path.write_text("A=1\nB=2\nC=3\n", encoding="utf-8")
+            real_path.chmod(0o600)
+            env_path = Path(td) / ".env"
+            env_path.symlink_to(real_path)
+            _upsert_dotenv_values(env_path, [("A", "x"), ("C", "z"), ("D", "4"), ("E", "5")])
+            self.assertTrue(env_path.is_symlink())
+            self.assertEqual(
+                real_path.read_text(encoding="utf-8"),
+                "A=x\nB=2\nC=z\n\nD=4\nE=5\n",
+            )
+            self.assertEqual(stat.S_IMODE(real_path.stat().st_mode), 0o600)
+            self.assertEqual(sorted(p.name for p in Path(td).iterdir()), [".env", "real.env"])
+
+    def test_default_subdomain_label_collapses_separators(self) -> None:
+        self.assertEqual(_default_subdomain_label("My__App--Web"), "my-app-web")
+        self.assertEqual(_default_subdomain_label("-_-"), "service")
+        self.assertEqual(_default_subdomain_label("a" * 62 + "-b"), "a" * 62)
+
+    def test_port_available_probes_each_port_once_per_session(self) -> None:
+        _PORT_PROBE_CACHE.clear()
+        self.addCleanup(_PORT_PROBE_CACHE.clear)
+        with mock.patch("deploy_wizard.wizard.socket.socket") as socket_mock:
+            first = _port_available("127.0.0.1", 18080)
+            second = _port_available("127.0.0.1", 18080)
+        self.assertEqual(first, (True, ""))
+        self.assertEqual(second, first)
+        self.assertEqual(socket_mock.call_count, 1)
+
+    def test_auto_pick_port_reuses_earlier_probe_of_preferred_port(self) -> None:
+        _PORT_PROBE_CACHE.clear()
+        self.addCleanup(_PORT_PROBE_CACHE.clear)
+        with mock.patch("deploy_wizard.wizard.socket.socket") as socket_mock, \
+             mock.patch("deploy_wizard.wizard._suggest_port", return_value=8080), \
+             mock.patch("builtins.print"):
+            socket_mock.return_value.bind.side_effect = OSError("Address already in use")
+            http_ok, _ = _port_available("0.0.0.0", 80)
+            picked = _auto_pick_port(bind_host="0.0.0.0", preferred=80, label="HTTP")
+        self.assertFalse(http_ok)
+        self.assertEqual(picked, 8080)
+        self.assertEqual(socket_mock.call_count, 1)
+
+    def test_choose_services_accepts_padded_numbers_and_names(self) -> None:
+        with mock.patch("deploy_wizard.wizard._prompt", side_effect=["01, api, 1, 3"]), \
+             mock.patch("builtins.print"):
+            chosen = _choose_services(["web", "api", "worker"])
+        self.assertEqual(chosen, ("web", "api", "worker"))
+
     def test_collect_missing_compose_env_writes_prompted_values(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             src = Path(td)
@@ -49,39 +118,6 @@ class DeployWizardWizardTests(unittest.TestCase):
             self.assertIn("LLM_IMAGE=img-llm", env_content)
             self.assertIn("TTS_IMAGE=img-tts", env_content)
 
-    def test_build_compose_path_routes_skips_services_without_ports(self) -> None:
-        routes = _build_compose_path_routes(
-            host="apps.example.org",
-            services=["orchestrator", "workflow-studio", "nats", "mongo"],
-            service_ports={
-                "orchestrator": 8080,
-                "workflow-studio": 8000,
-            },
-        )
-        self.assertEqual(len(routes), 2)
-        parsed = [parse_proxy_route(item) for item in routes]
-        self.assertEqual(parsed[0].host, "apps.example.org")
-        self.assertEqual(parsed[0].path_prefix, "/orchestrator")
-        self.assertEqual(parsed[0].upstream_host, "orchestrator")
-        self.assertEqual(parsed[0].upstream_port, 8080)
-        self.assertEqual(parsed[1].path_prefix, "/workflow-studio")
-
-    def test_build_compose_subdomain_routes_skips_services_without_ports(self) -> None:
-        routes = _build_compose_subdomain_routes(
-            domain="example.org",
-            services=["orchestrator", "workflow-studio", "nats", "mongo"],
-            service_ports={
-                "orchestrator": 8080,
-                "workflow-studio": 8000,
-            },
-        )
-        self.assertEqual(len(routes), 2)
-        parsed = [parse_proxy_route(item) for item in routes]
-        self.assertEqual(parsed[0].host, "orchestrator.example.org")
-        self.assertEqual(parsed[0].path_prefix, "/")
-        self.assertEqual(parsed[1].host, "workflow-studio.example.org")
-        self.assertEqual(parsed[1].path_prefix, "/")
-
     def test_build_compose_subdomain_routes_deduplicates_labels(self) -> None:
         routes = _build_compose_subdomain_routes(
             domain="example.org",
@@ -91,27 +127,54 @@ class DeployWizardWizardTests(unittest.TestCase):
                 "my-service": 8002,
             },
         )
-        parsed = [parse_proxy_route(item) for item in routes]
+        parsed = list(routes)
         self.assertEqual(parsed[0].host, "my-service.example.org")
         self.assertEqual(parsed[1].host, "my-service-2.example.org")
 
-    def test_build_compose_subdomain_host_routes_uses_localhost_upstreams(self) -> None:
-        routes = _build_compose_subdomain_host_routes(
-            domain="example.org",
-            services=["orchestrator", "workflow-studio", "mongo"],
-            host_ports={
-                "orchestrator": 8080,
-                "workflow-studio": 8000,
-            },
+    def test_build_compose_path_routes_keeps_suffixed_paths_unique(self) -> None:
+        routes = _build_compose_path_routes(
+            host="_",
+            services=["api", "api-2", "API", "Api"],
+            service_ports={"api": 8000, "api-2": 8001, "API": 8002, "Api": 8003},
+        )
+        paths = [route.path_prefix for route in routes]
+        self.assertEqual(paths, ["/api", "/api-2", "/api-3", "/api-4"])
+
+    def test_build_compose_routes_skip_services_without_ports(self) -> None:
+        services = ["orchestrator", "workflow-studio", "nats", "mongo"]
+        ports = {"orchestrator": 8080, "workflow-studio": 8000}
+        cases = (
+            (
+                "path",
+                _build_compose_path_routes,
+                dict(host="apps.example.org", service_ports=ports),
+                (
+                    ProxyRoute("apps.example.org", "orchestrator", 8080, "/orchestrator"),
+                    ProxyRoute("apps.example.org", "workflow-studio", 8000, "/workflow-studio"),
+                ),
+            ),
+            (
+                "subdomain",
+                _build_compose_subdomain_routes,
+                dict(domain="example.org", service_ports=ports),
+                (
+                    ProxyRoute("orchestrator.example.org", "orchestrator", 8080),
+                    ProxyRoute("workflow-studio.example.org", "workflow-studio", 8000),
+                ),
+            ),
+            (
+                "subdomain-host",
+                _build_compose_subdomain_host_routes,
+                dict(domain="example.org", host_ports=ports),
+                (
+                    ProxyRoute("orchestrator.example.org", "127.0.0.1", 8080),
+                    ProxyRoute("workflow-studio.example.org", "127.0.0.1", 8000),
+                ),
+            ),
         )
-        parsed = [parse_proxy_route(item) for item in routes]
-        self.assertEqual(len(parsed), 2)
-        self.assertEqual(parsed[0].host, "orchestrator.example.org")
-        self.assertEqual(parsed[0].upstream_host, "127.0.0.1")
-        self.assertEqual(parsed[0].upstream_port, 8080)
-        self.assertEqual(parsed[1].host, "workflow-studio.example.org")
-        self.assertEqual(parsed[1].upstream_host, "127.0.0.1")
-        self.assertEqual(parsed[1].upstream_port, 8000)
+        for label, build, kwargs, expected in cases:
+            with self.subTest(label):
+                self.assertEqual(tuple(build(services=services, **kwargs)), expected)
 
 
 if __name__ == "__main__":